@@ -2,13 +2,20 @@ import os
 import csv
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_file
+from operator import itemgetter
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_from_directory, session, make_response
 from werkzeug.utils import secure_filename
 from utils.categorize import categorize_transaction
 from utils.finance import calculate_balances, check_balance_alerts, get_budget_summary
 from utils.quotes import get_daily_quote
-from utils.gamification import update_streak, get_user_stats, update_karma_points
+from utils.gamification import update_streak, get_user_stats, update_karma_points, batch_updates
+from utils.tail import read_tail_rows
+from utils.aggregates import get_spending_aggregates
+from utils.atomic import write_json_atomic
+from utils.csv_fast import fmt_row
+from utils.banks_cache import get_banks, get_payment_method_index, invalidate_banks_cache
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -16,6 +23,12 @@ logging.basicConfig(level=logging.DEBUG)
 app = Flask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET", "finla_secret_key_2025")
 
+# Run streak/karma bookkeeping off the request path unless disabled (e.g. for tests)
+app.config['BACKGROUND_BOOKKEEPING'] = os.environ.get('FINLA_BACKGROUND_BOOKKEEPING', '1') == '1'
+
+# A single worker keeps user_stats.json updates strictly ordered
+bookkeeping_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='bookkeeping')
+
 # Ensure data directory exists
 os.makedirs('data', exist_ok=True)
 
@@ -88,19 +101,66 @@ def update_income_data(monthly_income):
     }
     
     try:
-        with open('data/income.json', 'w') as f:
-            json.dump(income_data, f, indent=2)
+        write_json_atomic('data/income.json', income_data)
         return True
     except Exception as e:
         logging.error(f"Error updating income data: {e}")
         return False
 
+def files_etag(*paths):
+    """Build an ETag from the modification time and size of the given files"""
+    return '-'.join(f'{st.st_mtime_ns:x}.{st.st_size:x}' for st in map(os.stat, paths))
+
+def is_not_modified(etag):
+    """Check whether a GET can be answered with 304 for the given ETag"""
+    # Pending flash messages must be rendered, so those requests always get a full page
+    return (request.method == 'GET'
+            and not session.get('_flashes')
+            and request.if_none_match.contains(etag))
+
+def not_modified_response(etag):
+    """Empty 304 response carrying the ETag"""
+    response = make_response('', 304)
+    response.set_etag(etag)
+    return response
+
+def _log_bookkeeping_error(future):
+    """Report failures from background bookkeeping tasks"""
+    error = future.exception()
+    if error:
+        logging.error(f"Error updating user stats: {error}")
+
+def run_bookkeeping(*tasks):
+    """Run gamification updates in order, in the background when enabled"""
+    def run_all():
+        # One user_stats.json write for the whole sequence
+        with batch_updates():
+            for task, *args in tasks:
+                task(*args)
+    
+    if app.config['BACKGROUND_BOOKKEEPING']:
+        bookkeeping_executor.submit(run_all).add_done_callback(_log_bookkeeping_error)
+    else:
+        run_all()
+
 init_data_files()
 
+@app.after_request
+def add_cache_headers(response):
+    """Let browsers reuse chart data and static assets for a short while"""
+    if request.path.startswith('/api/'):
+        # Personal finance data: cacheable by the browser, never by shared proxies
+        response.headers['Cache-Control'] = 'private, max-age=30'
+    elif request.path.startswith('/static/'):
+        response.headers['Cache-Control'] = 'public, max-age=30'
+    return response
+
 @app.route('/')
 def index():
     """Home page with daily quote, balance, and visualizations"""
     quote = get_daily_quote()
+    
+    # Finance summaries share one set of memoized ledger totals
     balances = calculate_balances()
     alerts = check_balance_alerts()
     budget_summary = get_budget_summary()
@@ -109,10 +169,9 @@ def index():
     # Get recent transactions for quick view
     recent_transactions = []
     try:
-        with open('data/transactions.csv', 'r') as f:
-            reader = csv.DictReader(f)
-            transactions = list(reader)
-            recent_transactions = sorted(transactions, key=lambda x: x['date'], reverse=True)[:5]
+        # Only the tail of the append-only CSV is read, newest entries first
+        recent_transactions = sorted(read_tail_rows('data/transactions.csv', n=5),
+                                     key=lambda x: x['date'], reverse=True)
     except Exception as e:
         logging.error(f"Error reading transactions: {e}")
     
@@ -135,31 +194,18 @@ def add_transaction():
             payment_method = request.form['payment_method']
             date = request.form.get('date', datetime.now().strftime('%Y-%m-%d'))
             
-            # Get bank info
-            with open('data/banks.json', 'r') as f:
-                banks = json.load(f)
-            
-            bank = ''
-            if payment_method in banks:
-                bank = payment_method
-            else:
-                # Find linked bank for UPI
-                for bank_name, bank_info in banks.items():
-                    if bank_info.get('upi_apps') and payment_method in bank_info['upi_apps']:
-                        bank = bank_name
-                        break
+            # Resolve the bank directly or via its linked UPI app
+            bank = get_payment_method_index().get(payment_method, '')
             
             # Categorize transaction
             category = categorize_transaction(description)
             
             # Save transaction
             with open('data/transactions.csv', 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([date, amount, description, category, payment_method, bank])
+                f.write(fmt_row(date, amount, description, category, payment_method, bank))
             
             # Update streak and karma points
-            update_streak()
-            update_karma_points(category, amount)
+            run_bookkeeping((update_streak,), (update_karma_points, category, amount))
             
             flash('Transaction added successfully!', 'success')
             return redirect(url_for('index'))
@@ -169,8 +215,7 @@ def add_transaction():
             flash('Error adding transaction. Please try again.', 'error')
     
     # Get banks and UPI apps for form
-    with open('data/banks.json', 'r') as f:
-        banks = json.load(f)
+    banks = get_banks()
     
     # Get today's date for the form
     today_date = datetime.now().strftime('%Y-%m-%d')
@@ -194,36 +239,51 @@ def upload_transactions():
             try:
                 # Read uploaded CSV
                 content = file.read().decode('utf-8')
-                csv_reader = csv.DictReader(content.splitlines())
+                csv_reader = csv.reader(content.splitlines())
                 
-                transactions_added = 0
-                with open('data/transactions.csv', 'a', newline='') as f:
-                    writer = csv.writer(f)
+                pm_index = get_payment_method_index()
+                today = datetime.now().strftime('%Y-%m-%d')
+                
+                # Resolve column positions once from the header
+                header = next(csv_reader, [])
+                width = len(header)
+                column_index = {name: i for i, name in enumerate(header)}
+                
+                # Columns missing from the upload read these defaults, appended past the row's end
+                defaults = {'date': today, 'amount': '0', 'description': '', 'payment_method': ''}
+                missing = [name for name in defaults if name not in column_index]
+                for offset, name in enumerate(missing):
+                    column_index[name] = width + offset
+                fill = [defaults[name] for name in missing]
+                padding = [''] * width
+                
+                columns = itemgetter(column_index['date'], column_index['amount'],
+                                     column_index['description'], column_index['payment_method'])
+                
+                rows_out = []
+                for row in csv_reader:
+                    if not row:
+                        continue
+                    if len(row) != width:
+                        # Short rows read empty fields, extra fields are ignored
+                        row = row[:width] + padding[len(row):]
+                    if fill:
+                        row += fill
+                    date, amount, description, payment_method = columns(row)
+                    amount = float(amount)
+                    
+                    # Get bank for payment method
+                    bank = pm_index.get(payment_method, '')
                     
-                    for row in csv_reader:
-                        amount = float(row.get('amount', 0))
-                        description = row.get('description', '')
-                        payment_method = row.get('payment_method', '')
-                        date = row.get('date', datetime.now().strftime('%Y-%m-%d'))
-                        
-                        # Get bank for payment method
-                        with open('data/banks.json', 'r') as bank_file:
-                            banks = json.load(bank_file)
-                        
-                        bank = ''
-                        if payment_method in banks:
-                            bank = payment_method
-                        else:
-                            for bank_name, bank_info in banks.items():
-                                if bank_info.get('upi_apps') and payment_method in bank_info['upi_apps']:
-                                    bank = bank_name
-                                    break
-                        
-                        category = categorize_transaction(description)
-                        writer.writerow([date, amount, description, category, payment_method, bank])
-                        transactions_added += 1
+                    category = categorize_transaction(description)
+                    rows_out.append((date, amount, description, category, payment_method, bank))
+                
+                # Append all parsed rows with a single buffered write
+                with open('data/transactions.csv', 'a', newline='', buffering=1 << 20) as f:
+                    csv.writer(f).writerows(rows_out)
+                transactions_added = len(rows_out)
                 
-                update_streak()
+                run_bookkeeping((update_streak,))
                 flash(f'{transactions_added} transactions uploaded successfully!', 'success')
                 return redirect(url_for('index'))
                 
@@ -241,19 +301,18 @@ def analytics():
     balances = calculate_balances()
     budget_summary = get_budget_summary()
     
-    # Get transaction data for charts
-    transactions = []
+    # Aggregate transaction data for charts
+    category_data, daily_data = {}, {}
     try:
-        with open('data/transactions.csv', 'r') as f:
-            reader = csv.DictReader(f)
-            transactions = list(reader)
+        category_data, daily_data = get_spending_aggregates()
     except Exception as e:
         logging.error(f"Error reading transactions: {e}")
     
     return render_template('analytics.html', 
                          balances=balances,
                          budget_summary=budget_summary,
-                         transactions=transactions)
+                         category_data=category_data,
+                         daily_data=daily_data)
 
 @app.route('/banks', methods=['GET', 'POST'])
 def manage_banks():
@@ -265,8 +324,8 @@ def manage_banks():
             min_balance = float(request.form['min_balance'])
             upi_apps = request.form.getlist('upi_apps')
             
-            with open('data/banks.json', 'r') as f:
-                banks = json.load(f)
+            # Copy so the shared cached dict is never mutated
+            banks = dict(get_banks())
             
             banks[bank_name] = {
                 'initial_balance': initial_balance,
@@ -274,8 +333,8 @@ def manage_banks():
                 'upi_apps': upi_apps
             }
             
-            with open('data/banks.json', 'w') as f:
-                json.dump(banks, f, indent=2)
+            write_json_atomic('data/banks.json', banks)
+            invalidate_banks_cache()
             
             flash('Bank added successfully!', 'success')
             return redirect(url_for('manage_banks'))
@@ -284,12 +343,19 @@ def manage_banks():
             logging.error(f"Error adding bank: {e}")
             flash('Error adding bank. Please try again.', 'error')
     
-    with open('data/banks.json', 'r') as f:
-        banks = json.load(f)
+    # The page shows balances too, so it changes with the ledger as well as banks.json
+    etag = files_etag('data/banks.json', 'data/transactions.csv',
+                      'templates/banks.html', 'templates/base.html')
+    if is_not_modified(etag):
+        return not_modified_response(etag)
+    
+    banks = get_banks()
     
     balances = calculate_balances()
     
-    return render_template('banks.html', banks=banks, balances=balances)
+    response = make_response(render_template('banks.html', banks=banks, balances=balances))
+    response.set_etag(etag)
+    return response
 
 @app.route('/goals', methods=['GET', 'POST'])
 def manage_goals():
@@ -315,8 +381,7 @@ def manage_goals():
             
             goals.append(new_goal)
             
-            with open('data/goals.json', 'w') as f:
-                json.dump(goals, f, indent=2)
+            write_json_atomic('data/goals.json', goals)
             
             flash('Goal added successfully!', 'success')
             return redirect(url_for('manage_goals'))
@@ -325,33 +390,24 @@ def manage_goals():
             logging.error(f"Error adding goal: {e}")
             flash('Error adding goal. Please try again.', 'error')
     
+    # Days remaining are counted from today, so the page also changes at midnight
+    etag = files_etag('data/goals.json', 'templates/goals.html', 'templates/base.html')
+    etag += '-' + datetime.now().strftime('%Y-%m-%d')
+    if is_not_modified(etag):
+        return not_modified_response(etag)
+    
     with open('data/goals.json', 'r') as f:
         goals = json.load(f)
     
-    return render_template('goals.html', goals=goals)
+    response = make_response(render_template('goals.html', goals=goals))
+    response.set_etag(etag)
+    return response
 
 @app.route('/api/chart_data')
 def chart_data():
     """API endpoint for chart data"""
     try:
-        with open('data/transactions.csv', 'r') as f:
-            reader = csv.DictReader(f)
-            transactions = list(reader)
-        
-        # Process data for charts
-        category_data = {}
-        daily_data = {}
-        
-        for transaction in transactions:
-            category = transaction['category']
-            amount = float(transaction['amount'])
-            date = transaction['date']
-            
-            # Category totals
-            category_data[category] = category_data.get(category, 0) + amount
-            
-            # Daily totals
-            daily_data[date] = daily_data.get(date, 0) + amount
+        category_data, daily_data = get_spending_aggregates()
         
         return jsonify({
             'categories': category_data,
@@ -366,9 +422,14 @@ def chart_data():
 def export_transactions():
     """Export transactions as CSV"""
     try:
-        return send_file('data/transactions.csv', 
-                        as_attachment=True, 
-                        download_name=f'finla_transactions_{datetime.now().strftime("%Y%m%d")}.csv')
+        # Conditional response: repeat exports revalidate via ETag/Last-Modified and get a 304
+        return send_from_directory('data', 'transactions.csv',
+                                   as_attachment=True,
+                                   download_name=f'finla_transactions_{datetime.now().strftime("%Y%m%d")}.csv',
+                                   conditional=True,
+                                   etag=True,
+                                   last_modified=os.path.getmtime('data/transactions.csv'),
+                                   max_age=0)
     except Exception as e:
         logging.error(f"Error exporting transactions: {e}")
         flash('Error exporting transactions', 'error')
@@ -400,4 +461,5 @@ def manage_income():
     return render_template('income.html', income_data=income_data)
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Production traffic is served by gunicorn (see .replit); this is the local dev server
+    app.run(host='0.0.0.0', port=5000, debug=bool(os.environ.get('FLASK_DEBUG')), threaded=True)
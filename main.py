@@ -1,4 +1,7 @@
+import os
+
 from app import app
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Production traffic is served by gunicorn (see .replit); this is the local dev server
+    app.run(host='0.0.0.0', port=5000, debug=bool(os.environ.get('FLASK_DEBUG')), threaded=True)
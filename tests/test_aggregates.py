@@ -0,0 +1,95 @@
+"""
+Finla - Spending Aggregates Tests
+Checks the incremental aggregates against rows appended to transactions.csv
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from utils import aggregates
+from utils.csv_fast import fmt_row
+
+HEADER = 'date,amount,description,category,payment_method,bank\r\n'
+
+
+class SpendingAggregatesTest(unittest.TestCase):
+    """Aggregates folded from a byte offset must survive malformed rows"""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.dir, 'transactions.csv')
+        patches = (
+            mock.patch.object(aggregates, 'TRANSACTIONS_FILE', self.csv_path),
+            mock.patch.object(aggregates, 'AGGREGATES_FILE', os.path.join(self.dir, 'aggregates.json')),
+            mock.patch.object(aggregates, '_state', None),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
+            f.write(HEADER)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _append(self, text):
+        with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_short_row_then_valid_append(self):
+        """A row missing trailing columns is padded and later appends still fold in"""
+        self._append('2026-10-14,20\r\n')
+        categories, daily = aggregates.get_spending_aggregates()
+        self.assertEqual(categories, {'': 20.0})
+        self.assertEqual(daily, {'2026-10-14': 20.0})
+        self.assertEqual(aggregates.get_daily_transaction_counts(), {'2026-10-14': 1})
+
+        self._append(fmt_row('2026-10-14', 50.0, 'lunch', 'food', 'UPI', 'HDFC'))
+        categories, daily = aggregates.get_spending_aggregates()
+        self.assertEqual(categories, {'': 20.0, 'food': 50.0})
+        self.assertEqual(daily, {'2026-10-14': 70.0})
+        self.assertEqual(aggregates.get_daily_transaction_counts(), {'2026-10-14': 2})
+
+    def test_date_only_row_counts_without_amount(self):
+        """A row with nothing but a date counts that day but adds no spending"""
+        self._append('2026-10-14\r\n\r\n')
+        self._append(fmt_row('2026-10-15', 10.0, 'bus', 'transport', 'Cash', 'SBI'))
+        categories, daily = aggregates.get_spending_aggregates()
+        self.assertEqual(categories, {'transport': 10.0})
+        self.assertEqual(daily, {'2026-10-15': 10.0})
+        self.assertEqual(aggregates.get_daily_transaction_counts(),
+                         {'2026-10-14': 1, '2026-10-15': 1})
+
+    def test_undecodable_byte_touches_only_its_row(self):
+        """A non-UTF-8 description still counts its row and later appends fold in"""
+        with open(self.csv_path, 'ab') as f:
+            f.write(b'2026-10-14,30,caf\xe9,food,Cash,SBI\r\n')
+        self._append(fmt_row('2026-10-15', 5.0, 'tea', 'snacks', 'UPI', 'HDFC'))
+        categories, daily = aggregates.get_spending_aggregates()
+        self.assertEqual(categories, {'food': 30.0, 'snacks': 5.0})
+        self.assertEqual(daily, {'2026-10-14': 30.0, '2026-10-15': 5.0})
+
+    def test_ledger_totals_fold_incrementally(self):
+        """Bank, day and month totals grow with appends without changing earlier results"""
+        self._append(fmt_row('2026-09-30', 40.0, 'rice', 'food', 'UPI', ' HDFC '))
+        self._append(fmt_row('2026-10-01', 15.0, 'bus', 'transport', 'Cash', 'SBI'))
+        before = aggregates.get_ledger_totals()
+        self.assertEqual(before['bank'], {'HDFC': 40.0, 'SBI': 15.0})
+        self.assertEqual(before['month'], {'2026-09': {'food': 40.0}, '2026-10': {'transport': 15.0}})
+
+        self._append(fmt_row('2026-10-01', 5.0, 'tea', 'food', 'UPI', 'HDFC'))
+        after = aggregates.get_ledger_totals()
+        self.assertEqual(after['bank'], {'HDFC': 45.0, 'SBI': 15.0})
+        self.assertEqual(after['day']['2026-10-01'], {'transport': 15.0, 'food': 5.0})
+        self.assertEqual(after['month']['2026-10'], {'transport': 15.0, 'food': 5.0})
+
+        # Results handed out before the append are left as they were
+        self.assertEqual(before['day']['2026-10-01'], {'transport': 15.0})
+        self.assertEqual(before['month']['2026-10'], {'transport': 15.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Finla - Transaction Categorization Tests
+Checks the combined trie scan and cached scoring against a per-category reference scorer
+"""
+
+import re
+import unittest
+
+from utils.categorize import TransactionCategorizer
+
+# Descriptions with overlapping phrases ('amazon prime' / 'amazon', 'street food' / 'food'),
+# keywords shared between categories ('delivery', 'ticket', 'water', 'mobile'), prefix-sharing
+# keywords ('game' / 'gaming', 'tea' / 'test', 'car' / 'cab' / 'cake') and words that only
+# start with a keyword ('bookmyshow', 'funds', 'penny')
+DESCRIPTIONS = (
+    'Amazon Prime subscription',
+    'amazon order delivery',
+    'Street food and chaat',
+    'Zomato food delivery',
+    'Movie ticket + train ticket',
+    'Water bill',
+    'mineral water bottle',
+    'Mobile recharge jio',
+    'New mobile from Flipkart',
+    'gaming cafe game night',
+    'tea and test strips',
+    'car wash, cab fare, cake',
+    'bookmyshow tickets',
+    'mutual funds sip',
+    'penny stocks',
+    'ice cream & cold drink',
+    'soft drink shake',
+    "Lunch at McDonald's",
+    'UPI-Swiggy order',
+    'paid to  auto rickshaw',
+    'PhonePe-Apollo pharmacy medicine',
+    'Café latte with coffee',
+    'चाय tea stall',
+    'max fortis lab scan test',
+    'eye checkup',
+    'haircut-salon spa massage',
+    'electricity, internet & wifi bill',
+    'rent emi maintenance',
+    'Random payment',
+    '!!!',
+    '',
+)
+
+AMOUNTS = (0, 30, 80, 150, 450, 1500, 7000, 25000)
+
+
+def reference_categorize(categorizer, description, amount):
+    """Score every category with its own pattern, as the categorizer did before the trie scan"""
+    if not description:
+        return 'others', 0.0
+
+    clean = description.lower().strip()
+    for prefix in TransactionCategorizer._PREFIXES:
+        if clean.startswith(prefix):
+            clean = clean[len(prefix):].strip()
+    clean = re.sub(r'\s+', ' ', re.sub(r'[^\w\s\-]', ' ', clean))
+
+    matches = []
+    for category, data in categorizer.categories.items():
+        pattern = r'\b(?:' + '|'.join(re.escape(keyword) for keyword in data['keywords']) + r')\b'
+        match_count = len(re.findall(pattern, clean, re.IGNORECASE))
+        if not match_count:
+            continue
+
+        amount_adjustment = 0
+        amount_range = TransactionCategorizer._TYPICAL_RANGES.get(category)
+        if amount > 0 and amount_range:
+            min_amt, max_amt = amount_range
+            if min_amt <= amount <= max_amt:
+                amount_adjustment = 0.1
+            elif amount < min_amt * 0.5 or amount > max_amt * 2:
+                amount_adjustment = -0.1
+
+        confidence = (0.7 + min(match_count * 0.1, 0.3) + (10 - data['priority']) * 0.02
+                      + amount_adjustment + min(len(clean.split()) * 0.01, 0.1))
+        matches.append((category, min(confidence, 1.0)))
+
+    if matches:
+        matches.sort(key=lambda x: x[1], reverse=True)
+        return matches[0]
+    return categorizer._categorize_by_amount(amount), 0.3
+
+
+class CategorizeEquivalenceTest(unittest.TestCase):
+    """categorize must give exactly the reference category and confidence"""
+
+    def setUp(self):
+        self.categorizer = TransactionCategorizer()
+
+    def test_matches_reference_scorer(self):
+        """Same category and confidence for every description and amount"""
+        for description in DESCRIPTIONS:
+            for amount in AMOUNTS:
+                with self.subTest(description=description, amount=amount):
+                    self.assertEqual(self.categorizer.categorize(description, amount),
+                                     reference_categorize(self.categorizer, description, amount))
+
+    def test_cached_scoring_terms_match_reference(self):
+        """Repeated descriptions served from the scoring cache score like fresh ones"""
+        for _ in range(2):
+            for amount in reversed(AMOUNTS):
+                for description in DESCRIPTIONS:
+                    with self.subTest(description=description, amount=amount):
+                        self.assertEqual(self.categorizer.categorize(description, amount),
+                                         reference_categorize(self.categorizer, description, amount))
+        self.assertGreater(self.categorizer._cached_scoring_terms.cache_info().hits, 0)
+
+    def test_ascii_table_matches_regex_cleaning(self):
+        """The ASCII translate table replaces exactly what the special-character regex does"""
+        ascii_text = ''.join(map(chr, range(128)))
+        self.assertEqual(self.categorizer._clean_description(ascii_text),
+                         ' '.join(re.sub(r'[^\w\s\-]', ' ', ascii_text.lower().strip()).split()))
+
+
+if __name__ == '__main__':
+    unittest.main()
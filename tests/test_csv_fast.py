@@ -0,0 +1,65 @@
+"""
+Finla - CSV Row Formatting Tests
+Checks fmt_row against csv.writer with the default dialect
+"""
+
+import csv
+import io
+import itertools
+import unittest
+
+from utils.csv_fast import fmt_row
+
+# Field values that need quoting, escaping or special handling under QUOTE_MINIMAL
+AWKWARD_FIELDS = (
+    '', None, 'plain', 'a,b', 'say "hi"', '"', '""', 'line\nbreak', 'cr\rlf\r\n',
+    ' padded ', 'tab\there', 'comma, "quote" and\nnewline', 'café ☕', "it's",
+)
+
+
+def writer_row(*fields):
+    """The line csv.writer writes for fields"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(fields)
+    return buffer.getvalue()
+
+
+class FmtRowTest(unittest.TestCase):
+    """fmt_row must produce exactly what csv.writer(f).writerow(...) writes"""
+
+    def test_awkward_text_fields(self):
+        """Commas, quotes, newlines and empty or None values in every text column"""
+        for value in AWKWARD_FIELDS:
+            for column in range(6):
+                row = ['2026-10-14', 120.5, 'lunch', 'food', 'UPI', 'HDFC']
+                row[column] = value
+                with self.subTest(column=column, value=value):
+                    self.assertEqual(fmt_row(*row), writer_row(*row))
+
+    def test_field_combinations(self):
+        """Several awkward fields in one row"""
+        for description, payment_method, bank in itertools.product(AWKWARD_FIELDS, repeat=3):
+            row = ('2026-10-14', 99.0, description, 'others', payment_method, bank)
+            with self.subTest(row=row):
+                self.assertEqual(fmt_row(*row), writer_row(*row))
+
+    def test_amounts(self):
+        """Numbers are written with the same text as csv.writer"""
+        for amount in (0, 0.0, 1, -5.25, 1e-7, 12345678901234.5, 0.1 + 0.2, float('inf')):
+            row = ('2026-10-14', amount, 'x', 'food', 'UPI', 'HDFC')
+            with self.subTest(amount=amount):
+                self.assertEqual(fmt_row(*row), writer_row(*row))
+
+    def test_all_empty_row(self):
+        """A row of only empty fields"""
+        self.assertEqual(fmt_row('', '', '', '', '', ''), writer_row('', '', '', '', '', ''))
+        self.assertEqual(fmt_row(None, None, None, None, None, None), writer_row(*[None] * 6))
+
+    def test_round_trip(self):
+        """csv.reader reads back the original text fields"""
+        row = ('2026-10-14', '10', 'comma, "quote" and\nnewline', 'food', '', 'HDFC')
+        self.assertEqual(next(csv.reader(io.StringIO(fmt_row(*row), newline=''))), list(row))
+
+
+if __name__ == '__main__':
+    unittest.main()
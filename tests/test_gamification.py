@@ -0,0 +1,257 @@
+"""
+Finla - Gamification Tests
+Checks streaks, weekly counters, levels and stats migration against temp data files
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import date
+from unittest import mock
+
+from utils import aggregates
+from utils.csv_fast import fmt_row
+from utils import gamification
+from utils.gamification import GamificationManager
+
+HEADER = 'date,amount,description,category,payment_method,bank\r\n'
+
+
+class GamificationTestCase(unittest.TestCase):
+    """A GamificationManager whose stats and ledger live in a temp directory"""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.dir, 'transactions.csv')
+        patches = (
+            mock.patch.object(aggregates, 'TRANSACTIONS_FILE', self.csv_path),
+            mock.patch.object(aggregates, 'AGGREGATES_FILE', os.path.join(self.dir, 'aggregates.json')),
+            mock.patch.object(aggregates, '_state', None),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
+            f.write(HEADER)
+
+        self.manager = GamificationManager()
+        self.manager.user_stats_file = os.path.join(self.dir, 'user_stats.json')
+        self.manager.transactions_file = self.csv_path
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _append(self, text):
+        with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
+            f.write(text)
+
+    def _save_stats(self, **fields):
+        stats = self.manager._create_default_stats()
+        stats.update(fields)
+        self.manager._save_user_stats(stats)
+
+
+class StreakTest(GamificationTestCase):
+    """update_streak must keep counting whatever else is in the ledger"""
+
+    def test_malformed_row_does_not_stop_streak(self):
+        """A short row ahead of today's transaction still lets the streak advance"""
+        today = date.today()
+        self._save_stats(streak=2, max_streak=2,
+                         last_entry_date=date.fromordinal(today.toordinal() - 1).isoformat())
+        self._append(f'{today.isoformat()},20\r\n')
+        self._append(fmt_row(today.isoformat(), 50.0, 'lunch', 'food', 'UPI', 'HDFC'))
+
+        result = self.manager.update_streak()
+        self.assertEqual(result['streak'], 3)
+        self.assertEqual(result['max_streak'], 3)
+
+        # Later appends keep folding in instead of failing on the short row again
+        self._append(fmt_row(today.isoformat(), 10.0, 'bus', 'transport', 'Cash', 'SBI'))
+        self.assertTrue(self.manager._has_transaction_today(today.isoformat()))
+        self.assertEqual(aggregates.get_daily_transaction_counts()[today.isoformat()], 3)
+
+
+def _fixed_today(day):
+    """A date class whose today() is day, to patch over utils.gamification.date"""
+    class FixedDate(date):
+        @classmethod
+        def today(cls):
+            return day
+    return FixedDate
+
+
+class WeeklyCounterTest(GamificationTestCase):
+    """week_tx_count counts transactions from Monday and restarts each week"""
+
+    def _log_on(self, day):
+        with mock.patch.object(gamification, 'date', _fixed_today(day)):
+            self.manager.update_karma_points('food', 50)
+
+    def _weekly_on(self, day):
+        with mock.patch.object(gamification, 'date', _fixed_today(day)):
+            return self.manager.get_weekly_summary()['weekly_transactions']
+
+    def test_sunday_to_monday_rollover(self):
+        """Sunday still belongs to the week that started on Monday; the next Monday starts over"""
+        self._save_stats()
+        self._log_on(date(2026, 10, 12))  # Monday
+        self._log_on(date(2026, 10, 18))  # Sunday
+        self.assertEqual(self._weekly_on(date(2026, 10, 18)), 2)
+
+        # Nothing logged yet in the new week
+        self.assertEqual(self._weekly_on(date(2026, 10, 19)), 0)
+
+        self._log_on(date(2026, 10, 19))  # Monday
+        stats = self.manager.get_user_stats()
+        self.assertEqual(stats['week_start'], '2026-10-19')
+        self.assertEqual(stats['week_tx_count'], 1)
+        self.assertEqual(self._weekly_on(date(2026, 10, 19)), 1)
+
+
+class SchemaMigrationTest(GamificationTestCase):
+    """Stats files from before schema_version 2 are backfilled on load"""
+
+    def test_load_v1_stats_file(self):
+        """A v1 file keeps its values, gains the new fields and is saved as the current version"""
+        v1_stats = {
+            'streak': 4, 'max_streak': 7, 'last_entry_date': '2026-10-13', 'karma_points': 230,
+            'total_transactions': 31, 'achievements': ['first_transaction'], 'level': 2,
+            'experience_points': 0, 'streak_freeze_count': 2, 'weekly_goals_completed': 0,
+            'monthly_goals_completed': 0, 'total_karma_earned': 230, 'best_saving_week': 0,
+            'categories_used': ['food', 'transport'], 'first_transaction_date': '2026-09-01',
+            'last_achievement_date': ''
+        }
+        with open(self.manager.user_stats_file, 'w') as f:
+            json.dump(v1_stats, f)
+
+        stats = self.manager.get_user_stats()
+        self.assertEqual(stats['schema_version'], gamification._SCHEMA_VERSION)
+        self.assertEqual(stats['week_start'], '')
+        self.assertEqual(stats['week_tx_count'], 0)
+        self.assertEqual(stats['karma_points'], 230)
+        self.assertEqual(stats['achievements'], {'first_transaction'})
+        self.assertEqual(stats['categories_used'], {'food', 'transport'})
+        self.assertEqual(self.manager.get_weekly_summary()['weekly_transactions'], 0)
+
+        with open(self.manager.user_stats_file) as f:
+            saved = json.load(f)
+        self.assertEqual(saved['schema_version'], gamification._SCHEMA_VERSION)
+        self.assertEqual(saved['week_tx_count'], 0)
+        self.assertEqual(saved['categories_used'], ['food', 'transport'])
+
+
+class LevelProgressTest(unittest.TestCase):
+    """get_level_progress must span exactly the karma range _calculate_level gives each level"""
+
+    def setUp(self):
+        self.manager = GamificationManager()
+
+    def _progress(self, karma_points):
+        level = GamificationManager._calculate_level(karma_points)
+        return self.manager.get_level_progress({'level': level, 'karma_points': karma_points})
+
+    def assertProgress(self, karma_points, level, points_in_level, points_to_next, percentage):
+        progress = self._progress(karma_points)
+        self.assertEqual(progress['current_level'], level)
+        self.assertEqual(progress['points_in_level'], points_in_level)
+        self.assertEqual(progress['points_to_next'], points_to_next)
+        self.assertAlmostEqual(progress['progress_percentage'], percentage)
+
+    def test_table_threshold(self):
+        """Reaching a table threshold starts the next level at 0%"""
+        self.assertProgress(99, 1, 99, 1, 99.0)
+        self.assertProgress(100, 2, 0, 200, 0.0)
+        self.assertProgress(101, 2, 1, 199, 0.5)
+
+    def test_last_table_level_runs_to_first_step(self):
+        """Level 5 starts at 1000 and lasts until the first 500-point step at 2000"""
+        self.assertProgress(1000, 5, 0, 1000, 0.0)
+        self.assertProgress(1500, 5, 500, 500, 50.0)
+        self.assertProgress(1999, 5, 999, 1, 99.9)
+
+    def test_stepped_threshold(self):
+        """Past the table each level starts on a 500-point step"""
+        self.assertProgress(2000, 6, 0, 500, 0.0)
+        self.assertProgress(2001, 6, 1, 499, 0.2)
+        self.assertProgress(2500, 7, 0, 500, 0.0)
+
+    def test_max_level(self):
+        """Level stops at the cap and progress stays within 0-100%"""
+        self.assertProgress(9000, 20, 0, 500, 0.0)
+        self.assertProgress(9001, 20, 1, 499, 0.2)
+        self.assertProgress(20000, 20, 11000, 0, 100.0)
+
+
+class UserStatsCacheTest(GamificationTestCase):
+    """get_user_stats hands out copies of the cached stats"""
+
+    def test_returned_stats_do_not_alias_cache(self):
+        """Changing a returned dict or its sets leaves later reads untouched"""
+        self._save_stats(karma_points=40, achievements={'first_transaction'})
+        stats = self.manager.get_user_stats()
+        stats['karma_points'] = 0
+        stats['achievements'].add('streak_30')
+        stats['categories_used'].add('food')
+
+        fresh = self.manager.get_user_stats()
+        self.assertEqual(fresh['karma_points'], 40)
+        self.assertEqual(fresh['achievements'], {'first_transaction'})
+        self.assertEqual(fresh['categories_used'], set())
+
+    def test_snapshot_unchanged_by_later_update(self):
+        """Stats read before an update keep their values"""
+        self._save_stats()
+        stats = self.manager.get_user_stats()
+        self.manager.update_karma_points('food', 50)
+        self.assertEqual(stats['total_transactions'], 0)
+        self.assertEqual(stats['categories_used'], set())
+        self.assertEqual(self.manager.get_user_stats()['categories_used'], {'food'})
+
+
+class BatchUpdatesTest(GamificationTestCase):
+    """Batched updates must reach user_stats.json whatever other threads do meanwhile"""
+
+    def test_reload_during_batch_keeps_unsaved_update(self):
+        """A rewritten stats file read mid-batch does not discard the batch's changes"""
+        self._save_stats(karma_points=10, total_karma_earned=10)
+        with self.manager.batch_updates():
+            self.manager.update_karma_points('food', 50)
+            with open(self.manager.user_stats_file, 'w') as f:
+                json.dump({'karma_points': 10, 'total_karma_earned': 10, 'achievements': [],
+                           'categories_used': []}, f)
+            reader = threading.Thread(target=self.manager.get_user_stats)
+            reader.start()
+            reader.join()
+
+        with open(self.manager.user_stats_file) as f:
+            saved = json.load(f)
+        self.assertEqual(saved['total_transactions'], 1)
+        self.assertGreater(saved['karma_points'], 10)
+
+    def test_concurrent_updates_are_all_saved(self):
+        """Updates from several threads during a batch are all counted and flushed"""
+        self._save_stats()
+
+        def log_transactions():
+            for _ in range(50):
+                self.manager.update_karma_points('food', 500)
+
+        with self.manager.batch_updates():
+            threads = [threading.Thread(target=log_transactions) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        with open(self.manager.user_stats_file) as f:
+            saved = json.load(f)
+        self.assertEqual(saved['total_transactions'], 200)
+        self.assertEqual(saved['karma_points'], 12 + 200 * 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
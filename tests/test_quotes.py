@@ -0,0 +1,41 @@
+"""
+Finla - Quotes Tests
+Checks the weekly quote schedule
+"""
+
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from utils import quotes
+
+
+class FixedDateTime(datetime):
+    """datetime whose now() is a fixed Wednesday"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 10, 14, 9, 30)
+
+
+class WeeklyQuotesTest(unittest.TestCase):
+    """get_weekly_quotes returns one distinct quote for each of the next seven days"""
+
+    def test_weekly_quotes(self):
+        """Seven consecutive dates from today, each with its own quote"""
+        with mock.patch.object(quotes, 'datetime', FixedDateTime):
+            weekly = quotes.get_weekly_quotes()
+
+        self.assertEqual([quote['date'] for quote in weekly],
+                         [f'2026-10-{day}' for day in range(14, 21)])
+        self.assertEqual([quote['day_name'] for quote in weekly],
+                         ['Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday', 'Monday', 'Tuesday'])
+        self.assertEqual(len({quote['text'] for quote in weekly}), 7)
+
+        # Each day starts from its date seed in the full pool
+        all_quotes = quotes._get_manager().all_quotes
+        self.assertEqual(weekly[0]['text'], all_quotes[20261014 % len(all_quotes)].text)
+
+
+if __name__ == '__main__':
+    unittest.main()
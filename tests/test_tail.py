@@ -0,0 +1,62 @@
+"""
+Finla - CSV Tail Reader Tests
+Checks read_tail_rows against a full csv.DictReader parse
+"""
+
+import csv
+import os
+import tempfile
+import unittest
+
+from utils.csv_fast import fmt_row
+from utils.tail import read_tail_rows
+
+HEADER = 'date,amount,description,category,payment_method,bank\r\n'
+
+
+class ReadTailRowsTest(unittest.TestCase):
+    """read_tail_rows must return what DictReader(...)[-n:] returns"""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.csv')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _write(self, rows):
+        with open(self.path, 'w', newline='', encoding='utf-8') as f:
+            f.write(HEADER)
+            for row in rows:
+                f.write(fmt_row(*row))
+
+    def _expected(self, n):
+        with open(self.path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))[-n:]
+
+    def test_multiline_description(self):
+        """A quoted description spanning many lines is one row, whatever the block size"""
+        rows = [(f'2025-01-{day:02d}', 100.0 + day, f'item {day}', 'other', 'UPI', 'HDFC')
+                for day in range(1, 21)]
+        rows[-6] = ('2025-01-15', 42.0, '\n'.join(['note line'] * 90), 'other', 'UPI', 'HDFC')
+        rows[-3] = ('2025-01-18', 7.5, 'said "hi",\r\nthen left', 'food', 'Cash', 'SBI')
+        self._write(rows)
+
+        for block in (1, 2, 7, 64, 8192):
+            for n in (1, 3, 5, 6, 7, 25):
+                with self.subTest(block=block, n=n):
+                    self.assertEqual(read_tail_rows(self.path, n=n, block=block), self._expected(n))
+
+    def test_blank_lines_and_empty_file(self):
+        """Blank lines are skipped and a header-only file has no rows"""
+        self._write([])
+        self.assertEqual(read_tail_rows(self.path, n=5), [])
+
+        with open(self.path, 'a', newline='', encoding='utf-8') as f:
+            f.write(fmt_row('2025-02-01', 10.0, 'tea', 'food', 'UPI', 'HDFC'))
+            f.write('\r\n\r\n\r\n')
+        self.assertEqual(read_tail_rows(self.path, n=5, block=2), self._expected(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
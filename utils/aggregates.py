@@ -0,0 +1,206 @@
+"""
+Finla - Spending Aggregates Module
+Maintains per-category, per-day and per-bank spending totals and per-day transaction
+counts incrementally as transactions.csv grows
+"""
+
+import csv
+import io
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from utils.atomic import write_json_atomic
+
+TRANSACTIONS_FILE = os.path.join('data', 'transactions.csv')
+AGGREGATES_FILE = os.path.join('data', 'aggregates.json')
+
+# Aggregates for the CSV prefix already folded in, shared by all request threads
+_state: Optional[Dict] = None
+_lock = threading.Lock()
+
+
+def _empty_state(inode: int) -> Dict:
+    """Aggregates for a file nothing has been read from yet"""
+    return {
+        'categories': {},
+        'daily': {},
+        'counts': {},
+        'banks': {},
+        'day_categories': {},
+        'month_categories': {},
+        'offset': 0,
+        'inode': inode
+    }
+
+
+def _load_state() -> Optional[Dict]:
+    """Load the persisted aggregates, or None if missing, unreadable or from an older layout"""
+    try:
+        with open(AGGREGATES_FILE, 'r') as f:
+            state = json.load(f)
+        if _empty_state(0).keys() <= state.keys():
+            return state
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _save_state(state: Dict):
+    """Persist aggregates so a restarted worker resumes from the saved offset"""
+    write_json_atomic(AGGREGATES_FILE, state, indent=None)
+
+
+def _add_to_group(groups: Dict[str, Dict], copied: set, key: str, category: str, amount: float):
+    """
+    Add amount to groups[key][category]
+
+    Each inner dict is copied the first time a fold touches it, so readers
+    of the previous state never see it change.
+    """
+    if key in copied:
+        spending = groups[key]
+    else:
+        spending = groups[key] = dict(groups.get(key, ()))
+        copied.add(key)
+    spending[category] = spending.get(category, 0) + amount
+
+
+def _fold_new_rows(state: Dict) -> Dict:
+    """Return a copy of state with rows appended after state['offset'] added in"""
+    category_data = dict(state['categories'])
+    daily_data = dict(state['daily'])
+    daily_counts = dict(state['counts'])
+    bank_data = dict(state['banks'])
+    day_categories = dict(state['day_categories'])
+    month_categories = dict(state['month_categories'])
+    days_copied = set()
+    months_copied = set()
+
+    with open(TRANSACTIONS_FILE, 'rb') as f:
+        header = next(csv.reader([f.readline().decode('utf-8', 'replace')]), [])
+        start = max(state['offset'], f.tell())
+        f.seek(start)
+        data = f.read()
+
+    # Only complete lines are folded; a row still being appended waits for the next call
+    consumed = data.rfind(b'\n') + 1
+    # A stray non-UTF-8 byte only garbles its own field instead of failing every fold
+    reader = csv.reader(io.StringIO(data[:consumed].decode('utf-8', 'replace')))
+    width = len(header)
+    date_idx = header.index('date')
+    amount_idx = header.index('amount')
+    category_idx = header.index('category')
+    bank_idx = header.index('bank')
+
+    for row in reader:
+        if len(row) < width:
+            if not row:
+                continue  # Blank line
+            row += [''] * (width - len(row))
+
+        # Every row counts as a transaction that day, even one without a usable amount
+        date = row[date_idx]
+        category = row[category_idx]
+        daily_counts[date] = daily_counts.get(date, 0) + 1
+
+        try:
+            amount = float(row[amount_idx])
+        except ValueError:
+            continue  # Skip rows with an unreadable amount
+
+        # Category totals
+        category_data[category] = category_data.get(category, 0) + amount
+
+        # Daily totals
+        daily_data[date] = daily_data.get(date, 0) + amount
+
+        # Bank totals
+        bank = row[bank_idx].strip()
+        bank_data[bank] = bank_data.get(bank, 0) + amount
+
+        # Category totals within each day and each 'YYYY-MM' month
+        _add_to_group(day_categories, days_copied, date, category, amount)
+        _add_to_group(month_categories, months_copied, date[:7], category, amount)
+
+    return {
+        'categories': category_data,
+        'daily': daily_data,
+        'counts': daily_counts,
+        'banks': bank_data,
+        'day_categories': day_categories,
+        'month_categories': month_categories,
+        'offset': start + consumed,
+        'inode': state['inode']
+    }
+
+
+def _current_state() -> Dict:
+    """
+    Bring the aggregates up to date with transactions.csv
+
+    Only rows appended since the last call are parsed; the totals and the
+    byte offset they cover are kept in memory and in data/aggregates.json.
+    """
+    global _state
+
+    with _lock:
+        st = os.stat(TRANSACTIONS_FILE)
+        state = _state or _load_state()
+
+        # A replaced or truncated CSV invalidates the saved offset
+        if state is None or state['inode'] != st.st_ino or st.st_size < state['offset']:
+            state = _empty_state(st.st_ino)
+
+        if st.st_size > state['offset']:
+            folded = _fold_new_rows(state)
+            if folded['offset'] != state['offset']:
+                state = folded
+                _save_state(state)
+
+        _state = state
+        return state
+
+
+def get_spending_aggregates() -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Get total spending per category and per day
+
+    The returned dicts are shared and must not be mutated.
+
+    Returns:
+        Tuple[Dict[str, float], Dict[str, float]]: (category totals, daily totals)
+    """
+    state = _current_state()
+    return state['categories'], state['daily']
+
+
+def get_daily_transaction_counts() -> Dict[str, int]:
+    """
+    Get the number of transactions recorded per date
+
+    The returned dict is shared and must not be mutated.
+
+    Returns:
+        Dict[str, int]: Date string mapped to its transaction count
+    """
+    return _current_state()['counts']
+
+
+def get_ledger_totals() -> Dict[str, Dict]:
+    """
+    Get spending per bank, and per category within each day and month
+
+    The returned dicts are shared and must not be mutated.
+
+    Returns:
+        Dict[str, Dict]: 'bank' maps bank to total spent, 'day' maps date to
+        {category: spent}, and 'month' maps 'YYYY-MM' to {category: spent}
+    """
+    state = _current_state()
+    return {
+        'bank': state['banks'],
+        'day': state['day_categories'],
+        'month': state['month_categories']
+    }
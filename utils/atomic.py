@@ -0,0 +1,46 @@
+"""
+Finla - Atomic File Writes Module
+Replaces data files in one step so readers never see a half-written file
+"""
+
+import json
+import os
+import stat
+import tempfile
+from typing import Any, Optional
+
+
+def write_json_atomic(path: str, obj: Any, indent: Optional[int] = 2):
+    """
+    Write obj as JSON to path atomically
+
+    The data goes to a temporary file in the same directory which then
+    replaces path via os.replace, so concurrent readers see either the old
+    or the new contents, never a truncated file.
+
+    Args:
+        path (str): Destination file
+        obj (Any): JSON-serializable data
+        indent (Optional[int]): Indentation, or None for a single line
+    """
+    # Encode in one shot: json.dump issues a write per encoded chunk, while
+    # dumps joins the chunks once so the file gets a single write. (CPython's C
+    # encoder only kicks in for indent=None; indented output stays pure Python.)
+    data = json.dumps(obj, indent=indent, separators=(',', ':'))
+    
+    # A unique temporary file per call, so threads writing the same path
+    # never share (and truncate or move away) each other's file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(data)
+        # mkstemp creates the file 0600; keep the permissions of the file being replaced
+        try:
+            os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
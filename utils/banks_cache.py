@@ -0,0 +1,66 @@
+"""
+Finla - Bank Data Cache Module
+Keeps the parsed banks.json in memory and reloads it only when the file changes
+"""
+
+import json
+import os
+from typing import Dict
+
+BANKS_FILE = os.path.join('data', 'banks.json')
+
+# Parsed banks.json plus the file signature it was parsed from
+_banks_cache = {'mtime': 0, 'size': -1, 'data': {}, 'pm_index': {}}
+
+
+def _build_payment_method_index(banks: Dict) -> Dict[str, str]:
+    """Map every bank name and linked UPI app to the bank it debits"""
+    index = {}
+    for bank_name, bank_info in banks.items():
+        for app_name in bank_info.get('upi_apps') or []:
+            # The first bank listing an app wins, as in the original scan
+            index.setdefault(app_name, bank_name)
+    
+    # A payment method naming a bank directly always resolves to that bank
+    index.update((bank_name, bank_name) for bank_name in banks)
+    return index
+
+
+def get_banks() -> Dict:
+    """
+    Get bank accounts from banks.json, parsing the file only when it changed
+
+    The returned dict is shared between callers and must not be mutated;
+    copy it before making changes.
+
+    Returns:
+        Dict: Bank name mapped to its account info
+    """
+    st = os.stat(BANKS_FILE)
+    if st.st_mtime_ns != _banks_cache['mtime'] or st.st_size != _banks_cache['size']:
+        with open(BANKS_FILE, 'r') as f:
+            banks = json.load(f)
+        _banks_cache['data'] = banks
+        _banks_cache['pm_index'] = _build_payment_method_index(banks)
+        _banks_cache['mtime'] = st.st_mtime_ns
+        _banks_cache['size'] = st.st_size
+    return _banks_cache['data']
+
+
+def get_payment_method_index() -> Dict[str, str]:
+    """
+    Get the payment method to bank lookup for the current banks.json
+
+    The index is rebuilt together with the banks cache, so resolving a
+    payment method is a single dict lookup.
+
+    Returns:
+        Dict[str, str]: Payment method (bank name or UPI app) mapped to bank name
+    """
+    get_banks()
+    return _banks_cache['pm_index']
+
+
+def invalidate_banks_cache():
+    """Force the next get_banks() call to re-read banks.json"""
+    _banks_cache['mtime'] = 0
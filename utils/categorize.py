@@ -4,11 +4,40 @@ Automatically categorizes transactions based on description keywords
 """
 
 import re
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+from utils.regex_trie import trie_alternation
+
+# Characters replaced by spaces: anything but word chars, spaces and hyphens
+_SPECIAL_CHARS = re.compile(r'[^\w\s\-]')
+
+# Same replacement for ASCII text as a str.translate table, built from the pattern above
+_ASCII_SPECIAL_TABLE = str.maketrans({
+    c: ' ' for c in map(chr, range(128)) if _SPECIAL_CHARS.match(c)
+})
+
+
 class TransactionCategorizer:
     """Smart categorization system for financial transactions"""
     
+    # Common transaction prefixes stripped before matching
+    _PREFIXES = ('upi-', 'paytm-', 'gpay-', 'phonepe-', 'payment to', 'paid to')
+    
+    # Typical amount ranges for categories
+    _TYPICAL_RANGES = {
+        'snacks': (10, 100),
+        'food': (50, 500),
+        'transport': (20, 200),
+        'education': (100, 5000),
+        'shopping': (200, 10000),
+        'entertainment': (100, 1000),
+        'health': (100, 5000),
+        'utilities': (500, 5000),
+        'personal_care': (100, 2000)
+    }
+    
     def __init__(self):
         """Initialize categorizer with keyword mappings"""
         self.categories = {
@@ -105,14 +134,41 @@ class TransactionCategorizer:
         
         # Compile regex patterns for better performance
         self._compile_patterns()
+        
+        # Per-category scoring constants: (priority boost, typical amount range or None)
+        self._score_table = {
+            category: ((10 - data['priority']) * 0.02, self._TYPICAL_RANGES.get(category))
+            for category, data in self.categories.items()
+        }
+        
+        # Descriptions repeat heavily ('Uber trip', 'Zomato order'), so keyword hits
+        # and their amount-independent scores are memoized per cleaned description;
+        # the cache lives on the instance
+        self._cached_scoring_terms = lru_cache(maxsize=4096)(self._scoring_terms)
     
     def _compile_patterns(self):
-        """Compile regex patterns for each category"""
+        """Compile regex patterns for each category and a combined keyword scanner"""
         self.patterns = {}
         for category, data in self.categories.items():
             # Create regex pattern that matches whole words
             pattern = r'\b(?:' + '|'.join(re.escape(keyword) for keyword in data['keywords']) + r')\b'
             self.patterns[category] = re.compile(pattern, re.IGNORECASE)
+        
+        # Credit each keyword with the hits every category pattern finds in it, so
+        # shared keywords ('delivery', 'ticket') and overlapping phrases ('amazon'
+        # inside 'amazon prime') count exactly as separate per-category scans would
+        keywords = {keyword for data in self.categories.values() for keyword in data['keywords']}
+        self._keyword_hits = {}
+        for keyword in keywords:
+            self._keyword_hits[keyword] = tuple(
+                (category, len(pattern.findall(keyword)))
+                for category, pattern in self.patterns.items()
+                if pattern.search(keyword)
+            )
+        
+        # Single trie-shaped alternation over all keywords; the longest keyword
+        # ending on a word boundary wins, so phrases beat their prefixes
+        self._keyword_pattern = re.compile(r'\b(?:' + trie_alternation(keywords) + r')\b')
     
     def categorize(self, description: str, amount: float = 0) -> Tuple[str, float]:
         """
@@ -131,92 +187,94 @@ class TransactionCategorizer:
         # Clean and normalize description
         clean_desc = self._clean_description(description)
         
-        # Find matching categories
-        matches = []
-        for category, pattern in self.patterns.items():
-            match_count = len(pattern.findall(clean_desc))
-            if match_count > 0:
-                # Calculate confidence based on matches and category priority
-                confidence = self._calculate_confidence(
-                    category, match_count, clean_desc, amount
-                )
-                matches.append((category, confidence))
-        
-        if matches:
-            # Sort by confidence and return best match
-            matches.sort(key=lambda x: x[1], reverse=True)
-            return matches[0]
+        length_adjustment, candidates = self._cached_scoring_terms(clean_desc)
+        if candidates:
+            return self._best_match(candidates, length_adjustment, amount)
         
         # Apply amount-based rules if no keyword matches
         category = self._categorize_by_amount(amount)
         return category, 0.3  # Low confidence for amount-based categorization
     
-    def _clean_description(self, description: str) -> str:
-        """Clean and normalize transaction description"""
-        # Convert to lowercase
-        clean = description.lower().strip()
-        
-        # Remove common transaction prefixes/suffixes
-        prefixes = ['upi-', 'paytm-', 'gpay-', 'phonepe-', 'payment to', 'paid to']
-        for prefix in prefixes:
-            if clean.startswith(prefix):
-                clean = clean[len(prefix):].strip()
+    def _scoring_terms(self, clean_desc: str) -> Tuple[float, Tuple[Tuple, ...]]:
+        """
+        Precompute the parts of the confidence score that don't depend on amount
         
-        # Remove special characters but keep spaces and hyphens
-        clean = re.sub(r'[^\w\s\-]', ' ', clean)
+        Returns:
+            Tuple: (length_adjustment, candidates) where each candidate is
+            (category, base score from matches and priority, typical amount range)
+        """
+        # Description length adjustment (longer descriptions often more accurate)
+        length_adjustment = min(len(clean_desc.split()) * 0.01, 0.1)
         
-        # Remove extra whitespace
-        clean = re.sub(r'\s+', ' ', clean)
+        candidates = []
+        for category, match_count in self._count_category_hits(clean_desc):
+            priority_boost, amount_range = self._score_table[category]
+            base_score = 0.7 + min(match_count * 0.1, 0.3) + priority_boost
+            candidates.append((category, base_score, amount_range))
         
-        return clean
+        return length_adjustment, tuple(candidates)
     
-    def _calculate_confidence(self, category: str, match_count: int, 
-                            description: str, amount: float) -> float:
-        """Calculate confidence score for a category match"""
-        base_confidence = 0.7
-        
-        # Boost for multiple keyword matches
-        match_boost = min(match_count * 0.1, 0.3)
-        
-        # Category priority boost (higher priority = higher boost)
-        priority_boost = (10 - self.categories[category]['priority']) * 0.02
-        
-        # Amount-based adjustments
-        amount_adjustment = self._get_amount_adjustment(category, amount)
+    def _best_match(self, candidates: Tuple[Tuple, ...], length_adjustment: float,
+                    amount: float) -> Tuple[str, float]:
+        """
+        Finish scoring every matched category and return the most confident one
         
-        # Description length adjustment (longer descriptions often more accurate)
-        length_adjustment = min(len(description.split()) * 0.01, 0.1)
+        Confidence is base 0.7 plus boosts for keyword matches, category
+        priority, typical amount and description length, capped at 1.0.
+        Ties go to the category defined first.
+        """
+        best_category, best_confidence = None, -1.0
+        for category, base_score, amount_range in candidates:
+            # Amount-based adjustment: boost typical amounts, penalize atypical ones
+            amount_adjustment = 0
+            if amount > 0 and amount_range:
+                min_amt, max_amt = amount_range
+                if min_amt <= amount <= max_amt:
+                    amount_adjustment = 0.1
+                elif amount < min_amt * 0.5 or amount > max_amt * 2:
+                    amount_adjustment = -0.1
+            
+            # Same summation order as the full formula, so scores are unchanged
+            confidence = min(base_score + amount_adjustment + length_adjustment, 1.0)  # Cap at 1.0
+            
+            if confidence > best_confidence:
+                best_category, best_confidence = category, confidence
         
-        confidence = base_confidence + match_boost + priority_boost + amount_adjustment + length_adjustment
+        return best_category, best_confidence
+    
+    def _count_category_hits(self, clean_desc: str) -> Tuple[Tuple[str, int], ...]:
+        """
+        Count keyword hits per category in a single scan of the description
         
-        return min(confidence, 1.0)  # Cap at 1.0
+        Returns:
+            Tuple[Tuple[str, int], ...]: (category, match_count) for matched
+            categories, in category definition order
+        """
+        counts = defaultdict(int)
+        for keyword in self._keyword_pattern.findall(clean_desc):
+            for category, hits in self._keyword_hits[keyword]:
+                counts[category] += hits
+        return tuple((category, counts[category]) for category in self.categories if category in counts)
     
-    def _get_amount_adjustment(self, category: str, amount: float) -> float:
-        """Adjust confidence based on typical amounts for categories"""
-        if amount <= 0:
-            return 0
+    def _clean_description(self, description: str) -> str:
+        """Clean and normalize transaction description"""
+        # Convert to lowercase
+        clean = description.lower().strip()
         
-        # Typical amount ranges for categories
-        typical_ranges = {
-            'snacks': (10, 100),
-            'food': (50, 500),
-            'transport': (20, 200),
-            'education': (100, 5000),
-            'shopping': (200, 10000),
-            'entertainment': (100, 1000),
-            'health': (100, 5000),
-            'utilities': (500, 5000),
-            'personal_care': (100, 2000)
-        }
+        # Remove common transaction prefixes/suffixes
+        for prefix in self._PREFIXES:
+            if clean.startswith(prefix):
+                clean = clean[len(prefix):].strip()
         
-        if category in typical_ranges:
-            min_amt, max_amt = typical_ranges[category]
-            if min_amt <= amount <= max_amt:
-                return 0.1  # Boost for typical amount
-            elif amount < min_amt * 0.5 or amount > max_amt * 2:
-                return -0.1  # Penalty for atypical amount
+        # Remove special characters but keep spaces and hyphens; plain ASCII
+        # (the common case) skips the regex engine
+        if clean.isascii():
+            clean = clean.translate(_ASCII_SPECIAL_TABLE)
+        else:
+            clean = _SPECIAL_CHARS.sub(' ', clean)
         
-        return 0
+        # Collapse extra whitespace
+        return ' '.join(clean.split())
     
     def _categorize_by_amount(self, amount: float) -> str:
         """Fallback categorization based on amount patterns"""
@@ -0,0 +1,41 @@
+"""
+Finla - Fast CSV Row Formatting Module
+Formats single transaction rows exactly as csv.writer would, without the writer machinery
+"""
+
+from typing import Any
+
+# Characters that force quoting under the default (excel) dialect
+_QUOTE_TRIGGERS = (',', '"', '\r', '\n')
+
+
+def _fmt_field(value: Any) -> str:
+    """Format one field with QUOTE_MINIMAL escaping"""
+    if value is None:
+        return ''
+    text = value if isinstance(value, str) else str(value)
+    for trigger in _QUOTE_TRIGGERS:
+        if trigger in text:
+            return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def fmt_row(date: str, amount: float, description: str, category: str,
+            payment_method: str, bank: str) -> str:
+    """
+    Format a transaction as one CSV line
+
+    Produces the same bytes as csv.writer(f).writerow(...) with the default
+    dialect: minimal quoting, doubled quote characters and a CRLF terminator.
+
+    Returns:
+        str: The formatted line including its line terminator
+    """
+    return ','.join((
+        _fmt_field(date),
+        _fmt_field(amount),
+        _fmt_field(description),
+        _fmt_field(category),
+        _fmt_field(payment_method),
+        _fmt_field(bank),
+    )) + '\r\n'
@@ -3,12 +3,74 @@ Finla - Financial Calculations and Analysis Module
 Handles balance calculations, budget analysis, and financial insights
 """
 
-import json
-import csv
+import math
 import os
+from bisect import bisect_right
+import threading
+from array import array
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
-from collections import defaultdict
+from functools import wraps
+
+from utils.aggregates import get_ledger_totals
+from utils.banks_cache import get_banks
+
+# 50/30/20 budget bucket per category: 0 = needs, 1 = wants; others count only towards the total
+_CAT_KIND = {
+    'food': 0, 'transport': 0, 'utilities': 0, 'health': 0,
+    'entertainment': 1, 'shopping': 1, 'snacks': 1, 'personal_care': 1
+}
+
+# Health score tables: budget health points, savings rate steps and grade bands
+_BUDGET_SCORES = {'excellent': 40, 'good': 30, 'fair': 20, 'poor': 10, 'unknown': 0}
+_SAVINGS_STEPS = (5, 10, 20)
+_SAVINGS_STEP_SCORES = (None, 15, 20, 30)  # Below the first step the rate itself is the score
+_GRADE_STEPS = (40, 60, 80)
+_GRADES = (('D', 'Needs Improvement'), ('C', 'Fair'), ('B', 'Good'), ('A', 'Excellent'))
+
+def _argmax_items(values: Dict[str, float]) -> Optional[Tuple[str, float]]:
+    """(key, value) with the largest value, first one on ties; None if empty"""
+    items = iter(values.items())
+    best = next(items, None)
+    if best is None:
+        return None
+    best_key, best_value = best
+    for key, value in items:
+        if value > best_value:
+            best_key, best_value = key, value
+    return best_key, best_value
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _memoize_on_data_files(method):
+    """
+    Cache a FinanceCalculator method's result until banks.json or transactions.csv changes
+    
+    Results are keyed by method name and arguments. Cached results are
+    shared between callers and must not be mutated.
+    """
+    name = method.__name__
+    
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._data_snapshot() as stamp:
+            if stamp != self._memo_stamp:
+                self._memo.clear()
+                self._memo_stamp = stamp
+            
+            key = (name,) + args + tuple(kwargs.items())
+            if key not in self._memo:
+                self._memo[key] = method(self, *args, **kwargs)
+            return self._memo[key]
+    
+    return wrapper
 
 class FinanceCalculator:
     """Core financial calculations for Finla"""
@@ -19,152 +81,200 @@ class FinanceCalculator:
         self.banks_file = os.path.join(self.data_dir, 'banks.json')
         self.transactions_file = os.path.join(self.data_dir, 'transactions.csv')
         self.goals_file = os.path.join(self.data_dir, 'goals.json')
+        
+        # Memoized results for the current (banks.json, transactions.csv) signatures
+        self._memo = {}
+        self._memo_stamp = None
+        
+        # Data file signatures for the calculation in progress on each thread
+        self._snapshot = threading.local()
     
-    def calculate_bank_balances(self) -> Dict:
-        """Calculate current balance for each bank account"""
+    @contextmanager
+    def _data_snapshot(self):
+        """
+        Stat banks.json and transactions.csv once for a whole chain of calculations
+        
+        Nested blocks on the same thread reuse the outermost block's signatures.
+        
+        Yields:
+            Tuple: (banks.json signature, transactions.csv signature), None for a missing file
+        """
+        stamp = getattr(self._snapshot, 'stamp', None)
+        if stamp is not None:
+            yield stamp
+            return
+        
+        stamp = (_file_signature(self.banks_file), _file_signature(self.transactions_file))
+        self._snapshot.stamp = stamp
         try:
-            # Load bank initial balances
-            with open(self.banks_file, 'r') as f:
-                banks = json.load(f)
+            yield stamp
+        finally:
+            self._snapshot.stamp = None
+    
+    @_memoize_on_data_files
+    def compute_balances_and_alerts(self) -> Tuple[Dict, List[Dict]]:
+        """
+        Calculate bank balances and low balance alerts together
+        
+        banks.json is read once and the bank totals looked up once for both results.
+        
+        Returns:
+            Tuple[Dict, List[Dict]]: ({'banks': ..., 'total': ...}, alerts)
+        """
+        balance_info = {'banks': {}, 'total': 0.0}
+        alerts = []
+        
+        with self._data_snapshot() as (banks_signature, _):
+            if banks_signature is None:
+                return balance_info, alerts
+        
+        try:
+            # Bank info, parsed at most once per banks.json change
+            banks = get_banks()
             
             # Initialize balances with initial amounts
             balances = {}
+            min_balances = {}
             for bank_name, bank_info in banks.items():
                 balances[bank_name] = float(bank_info.get('initial_balance', 0))
-            
-            # Load transactions and update balances
-            if os.path.exists(self.transactions_file):
-                with open(self.transactions_file, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        bank = row.get('bank', '').strip()
-                        amount = float(row.get('amount', 0))
-                        
-                        if bank and bank in balances:
-                            balances[bank] -= amount  # Subtract expense
-            
-            # Calculate total balance
-            total_balance = sum(balances.values())
-            
-            return {
-                'banks': balances,
-                'total': total_balance
-            }
-            
-        except Exception as e:
+                min_balances[bank_name] = float(bank_info.get('min_balance', 0))
+        except (OSError, ValueError, TypeError) as e:
             print(f"Error calculating balances: {e}")
-            return {'banks': {}, 'total': 0.0}
-    
-    def check_low_balance_alerts(self) -> List[Dict]:
-        """Check for low balance alerts"""
-        alerts = []
+            return balance_info, alerts
         
-        try:
-            # Load bank info
-            with open(self.banks_file, 'r') as f:
-                banks = json.load(f)
-            
-            # Get current balances
-            balance_info = self.calculate_bank_balances()
-            current_balances = balance_info['banks']
-            
-            # Check each bank against minimum balance
-            for bank_name, bank_info in banks.items():
-                current_balance = current_balances.get(bank_name, 0)
-                min_balance = float(bank_info.get('min_balance', 0))
-                
-                if current_balance <= min_balance:
-                    alerts.append({
-                        'bank': bank_name,
-                        'current_balance': current_balance,
-                        'min_balance': min_balance,
-                        'deficit': min_balance - current_balance,
-                        'severity': 'critical' if current_balance < 0 else 'warning'
-                    })
+        # Subtract each bank's expenses
+        spent_by_bank = self._ledger_totals()['bank']
+        for bank_name in balances:
+            if bank_name:
+                balances[bank_name] -= spent_by_bank.get(bank_name, 0.0)
+        
+        # Calculate total balance
+        balance_info = {
+            'banks': balances,
+            'total': sum(balances.values())
+        }
+        
+        # Check each bank against minimum balance
+        for bank_name, min_balance in min_balances.items():
+            current_balance = balances[bank_name]
             
-        except Exception as e:
-            print(f"Error checking balance alerts: {e}")
+            if current_balance <= min_balance:
+                alerts.append({
+                    'bank': bank_name,
+                    'current_balance': current_balance,
+                    'min_balance': min_balance,
+                    'deficit': min_balance - current_balance,
+                    'severity': 'critical' if current_balance < 0 else 'warning'
+                })
         
-        return alerts
+        return balance_info, alerts
     
-    def calculate_monthly_budget_summary(self, month: Optional[str] = None) -> Dict:
+    def calculate_bank_balances(self) -> Dict:
+        """Calculate current balance for each bank account"""
+        return self.compute_balances_and_alerts()[0]
+    
+    def check_low_balance_alerts(self) -> List[Dict]:
+        """Check for low balance alerts"""
+        return self.compute_balances_and_alerts()[1]
+    
+    def calculate_monthly_budget_summary(self, month: Optional[str] = None,
+                                         now: Optional[datetime] = None) -> Dict:
         """Calculate 50/30/20 budget analysis for given month"""
+        if now is None:
+            now = datetime.now()
         if not month:
-            month = datetime.now().strftime('%Y-%m')
+            month = now.strftime('%Y-%m')
         
-        try:
-            # Get total income/initial balance for budget calculation
-            balance_info = self.calculate_bank_balances()
-            total_available = balance_info['total']
-            
-            # If no balance, use default budget
-            if total_available <= 0:
-                total_available = 10000  # Default assumption
-            
-            # Calculate budget allocations (50/30/20 rule)
-            needs_budget = total_available * 0.5
-            wants_budget = total_available * 0.3
-            savings_target = total_available * 0.2
-            
-            # Calculate actual spending by category
-            monthly_spending = self.get_monthly_spending_by_category(month)
-            
-            # Map categories to budget types
-            needs_categories = ['food', 'transport', 'utilities', 'health']
-            wants_categories = ['entertainment', 'shopping', 'snacks', 'personal_care']
-            
-            needs_spent = sum(monthly_spending.get(cat, 0) for cat in needs_categories)
-            wants_spent = sum(monthly_spending.get(cat, 0) for cat in wants_categories)
-            total_spent = sum(monthly_spending.values())
-            
-            # Calculate actual savings (remaining balance)
-            savings_actual = max(total_available - total_spent, 0)
-            
-            return {
-                'month': month,
-                'total_budget': total_available,
-                'needs_budget': needs_budget,
-                'needs_spent': needs_spent,
-                'needs_remaining': needs_budget - needs_spent,
-                'wants_budget': wants_budget,
-                'wants_spent': wants_spent,
-                'wants_remaining': wants_budget - wants_spent,
-                'savings_target': savings_target,
-                'savings_actual': savings_actual,
-                'savings_shortfall': max(savings_target - savings_actual, 0),
-                'total_spent': total_spent,
-                'budget_health': self._calculate_budget_health(
-                    needs_spent, needs_budget, wants_spent, wants_budget
-                )
-            }
-            
-        except Exception as e:
-            print(f"Error calculating budget summary: {e}")
-            return self._get_empty_budget_summary()
+        # Get total income/initial balance for budget calculation
+        balance_info = self.calculate_bank_balances()
+        total_available = balance_info['total']
+        
+        # If no balance, use default budget
+        if total_available <= 0:
+            total_available = 10000  # Default assumption
+        
+        # Calculate budget allocations (50/30/20 rule)
+        needs_budget = total_available * 0.5
+        wants_budget = total_available * 0.3
+        savings_target = total_available * 0.2
+        
+        # Calculate actual spending by category
+        monthly_spending = self.get_monthly_spending_by_category(month)
+        
+        # Route each category's spending to its budget type in one pass
+        needs_spent = wants_spent = total_spent = 0
+        for category, amount in monthly_spending.items():
+            total_spent += amount
+            kind = _CAT_KIND.get(category)
+            if kind == 0:
+                needs_spent += amount
+            elif kind == 1:
+                wants_spent += amount
+        
+        # Calculate actual savings (remaining balance)
+        savings_actual = max(total_available - total_spent, 0)
+        
+        return {
+            'month': month,
+            'total_budget': total_available,
+            'needs_budget': needs_budget,
+            'needs_spent': needs_spent,
+            'needs_remaining': needs_budget - needs_spent,
+            'wants_budget': wants_budget,
+            'wants_spent': wants_spent,
+            'wants_remaining': wants_budget - wants_spent,
+            'savings_target': savings_target,
+            'savings_actual': savings_actual,
+            'savings_shortfall': max(savings_target - savings_actual, 0),
+            'total_spent': total_spent,
+            'budget_health': self._calculate_budget_health(
+                needs_spent, needs_budget, wants_spent, wants_budget
+            )
+        }
     
+    @_memoize_on_data_files
     def get_monthly_spending_by_category(self, month: str) -> Dict[str, float]:
         """Get spending breakdown by category for a specific month"""
-        spending = defaultdict(float)
+        # A full 'YYYY-MM' month is read straight from the grouped buckets
+        totals = self._ledger_totals()
+        if len(month) == 7:
+            return dict(totals['month'].get(month, {}))
+        
+        # Any other prefix, such as a bare year, combines the matching days
+        spending = {}
+        for date, day_spending in totals['day'].items():
+            if date.startswith(month):
+                for category, amount in day_spending.items():
+                    spending[category] = spending.get(category, 0.0) + amount
+        
+        return spending
+    
+    @_memoize_on_data_files
+    def _ledger_totals(self) -> Dict[str, Dict]:
+        """
+        Spending totals shared by every finance calculation
+        
+        They come from the incremental aggregates, which parse only the rows
+        appended to transactions.csv since they were last brought up to date.
+        
+        Returns:
+            Dict[str, Dict]: 'bank' maps bank to total spent, 'day' maps date to
+            {category: spent}, and 'month' maps 'YYYY-MM' to {category: spent}
+        """
+        empty = {'bank': {}, 'day': {}, 'month': {}}
+        with self._data_snapshot() as (_, signature):
+            if signature is None:
+                return empty
         
         try:
-            if os.path.exists(self.transactions_file):
-                with open(self.transactions_file, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        date = row.get('date', '')
-                        if date.startswith(month):
-                            category = row.get('category', 'others')
-                            amount = float(row.get('amount', 0))
-                            spending[category] += amount
-                            
-        except Exception as e:
-            print(f"Error getting monthly spending: {e}")
-        
-        return dict(spending)
+            return get_ledger_totals()
+        except (OSError, ValueError) as e:
+            print(f"Error loading transactions: {e}")
+            return empty
     
-    def get_spending_insights(self, days: int = 30) -> Dict:
+    def get_spending_insights(self, days: int = 30, now: Optional[datetime] = None) -> Dict:
         """Generate spending insights for the last N days"""
-        end_date = datetime.now()
+        end_date = now or datetime.now()
         start_date = end_date - timedelta(days=days)
         
         insights = {
@@ -176,70 +286,74 @@ class FinanceCalculator:
             'recommendations': []
         }
         
-        try:
-            daily_spending = defaultdict(float)
-            category_spending = defaultdict(float)
+        category_spending = {}
+        
+        # A row dated on the start day counts as its midnight, which is
+        # before start_date unless that is midnight too
+        first_day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        if first_day < start_date:
+            first_day += timedelta(days=1)
+        
+        # Every day in the window by ISO date, mapped to its chronological offset;
+        # the window is walked against the per-day totals instead of every row
+        window = (end_date.date() - first_day.date()).days + 1
+        day_index = {
+            (first_day + timedelta(days=offset)).strftime('%Y-%m-%d'): offset
+            for offset in range(window)
+        }
+        daily_spending = array('d', [0.0]) * window
+        has_spending = [False] * window
+        
+        by_day = self._ledger_totals()['day']
+        for date_str, offset in day_index.items():
+            day_spending = by_day.get(date_str)
+            if day_spending is not None:
+                has_spending[offset] = True
+                for category, amount in day_spending.items():
+                    daily_spending[offset] += amount
+                    category_spending[category] = category_spending.get(category, 0.0) + amount
+                    insights['total_spent'] += amount
+        
+        # Calculate insights
+        if insights['total_spent'] > 0 and days > 0:
+            insights['daily_average'] = insights['total_spent'] / days
+            
+            # Find top category
+            if category_spending:
+                insights['top_category'] = _argmax_items(category_spending)
             
-            if os.path.exists(self.transactions_file):
-                with open(self.transactions_file, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        date_str = row.get('date', '')
-                        if date_str:
-                            date = datetime.strptime(date_str, '%Y-%m-%d')
-                            if start_date <= date <= end_date:
-                                amount = float(row.get('amount', 0))
-                                category = row.get('category', 'others')
-                                
-                                daily_spending[date_str] += amount
-                                category_spending[category] += amount
-                                insights['total_spent'] += amount
+            # Analyze spending trend
+            insights['spending_trend'] = self._analyze_spending_trend(
+                [total for total, seen in zip(daily_spending, has_spending) if seen]
+            )
             
-            # Calculate insights
-            if insights['total_spent'] > 0:
-                insights['daily_average'] = insights['total_spent'] / days
-                
-                # Find top category
-                if category_spending:
-                    insights['top_category'] = max(category_spending.items(), key=lambda x: x[1])
-                
-                # Analyze spending trend
-                insights['spending_trend'] = self._analyze_spending_trend(daily_spending)
-                
-                # Generate recommendations
-                insights['recommendations'] = self._generate_recommendations(
-                    category_spending, insights['daily_average']
-                )
-        
-        except Exception as e:
-            print(f"Error generating insights: {e}")
+            # Generate recommendations
+            insights['recommendations'] = self._generate_recommendations(
+                insights['top_category'], insights['daily_average']
+            )
         
         return insights
     
-    def calculate_savings_rate(self, months: int = 3) -> float:
+    def calculate_savings_rate(self, months: int = 3, now: Optional[datetime] = None) -> float:
         """Calculate savings rate over the last N months"""
-        try:
-            # Get spending for last N months
-            total_spent = 0
-            current_date = datetime.now()
-            
-            for i in range(months):
-                month_date = current_date - timedelta(days=30 * i)
-                month_str = month_date.strftime('%Y-%m')
-                monthly_spending = self.get_monthly_spending_by_category(month_str)
-                total_spent += sum(monthly_spending.values())
-            
-            # Estimate income (simplified)
-            balance_info = self.calculate_bank_balances()
-            estimated_monthly_income = balance_info['total'] / months if months > 0 else 0
-            total_income = estimated_monthly_income * months
-            
-            if total_income > 0:
-                savings_rate = ((total_income - total_spent) / total_income) * 100
-                return max(savings_rate, 0)  # Don't return negative savings rate
-            
-        except Exception as e:
-            print(f"Error calculating savings rate: {e}")
+        # Get spending for last N months from the grouped ledger totals
+        by_month = self._ledger_totals()['month']
+        total_spent = 0
+        current_date = now or datetime.now()
+        
+        for i in range(months):
+            month_date = current_date - timedelta(days=30 * i)
+            month_str = month_date.strftime('%Y-%m')
+            total_spent += sum(by_month.get(month_str, {}).values())
+        
+        # Estimate income (simplified)
+        balance_info = self.calculate_bank_balances()
+        estimated_monthly_income = balance_info['total'] / months if months > 0 else 0
+        total_income = estimated_monthly_income * months
+        
+        if total_income > 0:
+            savings_rate = ((total_income - total_spent) / total_income) * 100
+            return max(savings_rate, 0)  # Don't return negative savings rate
         
         return 0.0
     
@@ -258,21 +372,25 @@ class FinanceCalculator:
         else:
             return 'poor'
     
-    def _analyze_spending_trend(self, daily_spending: Dict[str, float]) -> str:
-        """Analyze if spending is increasing, decreasing, or stable"""
-        if len(daily_spending) < 7:
+    def _analyze_spending_trend(self, daily_totals: List[float]) -> str:
+        """
+        Analyze if spending is increasing, decreasing, or stable
+        
+        Args:
+            daily_totals (List[float]): Spending per day that had any, oldest first
+        """
+        if len(daily_totals) < 7:
             return 'insufficient_data'
         
         # Get last 7 days and previous 7 days
-        sorted_dates = sorted(daily_spending.keys())
-        recent_week = sorted_dates[-7:]
-        previous_week = sorted_dates[-14:-7] if len(sorted_dates) >= 14 else []
+        recent_week = daily_totals[-7:]
+        previous_week = daily_totals[-14:-7] if len(daily_totals) >= 14 else []
         
         if len(previous_week) < 7:
             return 'insufficient_data'
         
-        recent_avg = sum(daily_spending[date] for date in recent_week) / 7
-        previous_avg = sum(daily_spending[date] for date in previous_week) / 7
+        recent_avg = math.fsum(recent_week) / 7
+        previous_avg = math.fsum(previous_week) / 7
         
         if recent_avg > previous_avg * 1.1:
             return 'increasing'
@@ -281,14 +399,14 @@ class FinanceCalculator:
         else:
             return 'stable'
     
-    def _generate_recommendations(self, category_spending: Dict[str, float], 
+    def _generate_recommendations(self, top_category: Optional[Tuple[str, float]],
                                 daily_average: float) -> List[str]:
-        """Generate spending recommendations based on patterns"""
+        """Generate spending recommendations from the top (category, amount) and daily average"""
         recommendations = []
         
-        # Find highest spending category
-        if category_spending:
-            top_category, top_amount = max(category_spending.items(), key=lambda x: x[1])
+        # Highest spending category, already found by the caller
+        if top_category:
+            top_category, top_amount = top_category
             
             # Category-specific recommendations
             if top_category == 'food' and top_amount > daily_average * 7:
@@ -307,32 +425,13 @@ class FinanceCalculator:
             recommendations.append("Great job keeping expenses low! Consider increasing savings rate")
         
         return recommendations
-    
-    def _get_empty_budget_summary(self) -> Dict:
-        """Return empty budget summary for error cases"""
-        return {
-            'month': datetime.now().strftime('%Y-%m'),
-            'total_budget': 0,
-            'needs_budget': 0,
-            'needs_spent': 0,
-            'needs_remaining': 0,
-            'wants_budget': 0,
-            'wants_spent': 0,
-            'wants_remaining': 0,
-            'savings_target': 0,
-            'savings_actual': 0,
-            'savings_shortfall': 0,
-            'total_spent': 0,
-            'budget_health': 'unknown'
-        }
 
 # Global calculator instance
 _calculator = FinanceCalculator()
 
 def calculate_balances() -> Dict:
     """Calculate current bank balances"""
-    balance_info = _calculator.calculate_bank_balances()
-    alerts = _calculator.check_low_balance_alerts()
+    balance_info, alerts = _calculator.compute_balances_and_alerts()
     
     return {
         **balance_info,
@@ -343,91 +442,64 @@ def check_balance_alerts() -> List[Dict]:
     """Check for low balance alerts"""
     return _calculator.check_low_balance_alerts()
 
-def get_budget_summary(month: Optional[str] = None) -> Dict:
+def get_budget_summary(month: Optional[str] = None, now: Optional[datetime] = None) -> Dict:
     """Get 50/30/20 budget summary"""
-    return _calculator.calculate_monthly_budget_summary(month)
+    return _calculator.calculate_monthly_budget_summary(month, now)
 
-def get_spending_insights(days: int = 30) -> Dict:
+def get_spending_insights(days: int = 30, now: Optional[datetime] = None) -> Dict:
     """Get spending insights for last N days"""
-    return _calculator.get_spending_insights(days)
+    return _calculator.get_spending_insights(days, now)
 
-def get_savings_rate(months: int = 3) -> float:
+def get_savings_rate(months: int = 3, now: Optional[datetime] = None) -> float:
     """Get savings rate for last N months"""
-    return _calculator.calculate_savings_rate(months)
+    return _calculator.calculate_savings_rate(months, now)
 
 def get_financial_health_score() -> Dict:
     """Calculate overall financial health score"""
-    try:
+    # Stat the data files and read the clock once, sharing them across every
+    # sub-calculation; the ledger totals behind them are built once too
+    with _calculator._data_snapshot():
+        now = datetime.now()
         balance_info = calculate_balances()
-        budget_summary = get_budget_summary()
-        savings_rate = get_savings_rate()
-        
-        # Calculate score based on multiple factors
-        score = 0
-        factors = []
-        
-        # Balance factor (30% weight)
-        if balance_info['total'] > 10000:
-            balance_score = min(balance_info['total'] / 50000 * 30, 30)
-        else:
-            balance_score = balance_info['total'] / 10000 * 30
-        score += balance_score
-        factors.append(f"Balance: {balance_score:.1f}/30")
-        
-        # Budget adherence factor (40% weight)
-        budget_health = budget_summary.get('budget_health', 'unknown')
-        budget_scores = {'excellent': 40, 'good': 30, 'fair': 20, 'poor': 10, 'unknown': 0}
-        budget_score = budget_scores.get(budget_health, 0)
-        score += budget_score
-        factors.append(f"Budget: {budget_score}/40")
-        
-        # Savings rate factor (30% weight)
-        if savings_rate >= 20:
-            savings_score = 30
-        elif savings_rate >= 10:
-            savings_score = 20
-        elif savings_rate >= 5:
-            savings_score = 15
-        else:
-            savings_score = savings_rate
-        score += savings_score
-        factors.append(f"Savings: {savings_score:.1f}/30")
-        
-        # Determine grade
-        if score >= 80:
-            grade = 'A'
-            status = 'Excellent'
-        elif score >= 60:
-            grade = 'B'
-            status = 'Good'
-        elif score >= 40:
-            grade = 'C'
-            status = 'Fair'
-        else:
-            grade = 'D'
-            status = 'Needs Improvement'
-        
-        return {
-            'score': round(score, 1),
-            'grade': grade,
-            'status': status,
-            'factors': factors,
-            'total_balance': balance_info['total'],
-            'budget_health': budget_health,
-            'savings_rate': savings_rate
-        }
-        
-    except Exception as e:
-        print(f"Error calculating financial health: {e}")
-        return {
-            'score': 0,
-            'grade': 'N/A',
-            'status': 'Unable to calculate',
-            'factors': [],
-            'total_balance': 0,
-            'budget_health': 'unknown',
-            'savings_rate': 0
-        }
+        budget_summary = get_budget_summary(now=now)
+        savings_rate = get_savings_rate(now=now)
+    
+    # Calculate score based on multiple factors
+    score = 0
+    factors = []
+    
+    # Balance factor (30% weight)
+    if balance_info['total'] > 10000:
+        balance_score = min(balance_info['total'] / 50000 * 30, 30)
+    else:
+        balance_score = balance_info['total'] / 10000 * 30
+    score += balance_score
+    factors.append(f"Balance: {balance_score:.1f}/30")
+    
+    # Budget adherence factor (40% weight)
+    budget_health = budget_summary.get('budget_health', 'unknown')
+    budget_score = _BUDGET_SCORES.get(budget_health, 0)
+    score += budget_score
+    factors.append(f"Budget: {budget_score}/40")
+    
+    # Savings rate factor (30% weight)
+    step = bisect_right(_SAVINGS_STEPS, savings_rate)
+    savings_score = _SAVINGS_STEP_SCORES[step] if step else savings_rate
+    score += savings_score
+    factors.append(f"Savings: {savings_score:.1f}/30")
+    
+    # Determine grade
+    grade, status = _GRADES[bisect_right(_GRADE_STEPS, score)]
+    
+    return {
+        'score': round(score, 1),
+        'grade': grade,
+        'status': status,
+        'factors': factors,
+        'total_balance': balance_info['total'],
+        'budget_health': budget_health,
+        'savings_rate': savings_rate
+    }
 
 if __name__ == "__main__":
     # Test finance calculations
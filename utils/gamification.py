@@ -5,19 +5,62 @@ Handles streaks, karma points, achievements, and user motivation systems
 
 import json
 import os
-from datetime import datetime, timedelta
+import threading
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from bisect import bisect_right
+from datetime import date, timedelta
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 
+from utils.aggregates import get_daily_transaction_counts
+from utils.atomic import write_json_atomic
+
+# Stats fields held as sets in memory and stored as JSON lists
+_SET_FIELDS = ('achievements', 'categories_used')
+
+# Bump when fields are added to _create_default_stats so older files get backfilled
+_SCHEMA_VERSION = 2
+
+def _locked(method):
+    """Run a GamificationManager method while holding the manager's lock"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    
+    return wrapper
+
 class GamificationManager:
     """Manages user engagement through streaks, karma points, and achievements"""
     
+    # Streak milestones in ascending order, paired with their achievement ids
+    _STREAK_MILESTONES = ((5, 'streak_5'), (10, 'streak_10'), (30, 'streak_30'))
+    
+    # Karma needed to reach levels 2-5; past the last one each level takes _LEVEL_STEP more
+    _LEVEL_THRESHOLDS = (100, 300, 600, 1000, 1500)
+    _LEVEL_STEP = 500
+    _MAX_LEVEL = 20
+    
     def __init__(self):
         """Initialize gamification system"""
         self.data_dir = 'data'
         self.user_stats_file = os.path.join(self.data_dir, 'user_stats.json')
         self.transactions_file = os.path.join(self.data_dir, 'transactions.csv')
         
+        # Parsed user_stats.json plus the file signature it was read at or written with
+        self._stats_cache = None
+        self._stats_signature = None
+        
+        # Unsaved changes to the cached stats, and how many batch_updates blocks are open
+        self._dirty = False
+        self._batch_depth = 0
+        
+        # Guards the cache, the dirty flag and saves; the bookkeeping worker and
+        # request threads share one manager. Reentrant since updates save through flush()
+        self._lock = threading.RLock()
+        
         # Achievement definitions
         self.achievements = {
             'first_transaction': {
@@ -85,6 +128,17 @@ class GamificationManager:
             }
         }
         
+        # Definitions are shared by every award and listing, so they are read-only
+        self.achievements = {achievement_id: MappingProxyType(data)
+                             for achievement_id, data in self.achievements.items()}
+        
+        # Achievement entries with their id baked in, highest points first
+        # (sorted() is stable, so ties keep definition order)
+        self._achievement_templates = sorted(
+            ({**data, 'id': achievement_id} for achievement_id, data in self.achievements.items()),
+            key=lambda x: -x['points']
+        )
+        
         # Karma point system
         self.karma_rules = {
             'transaction_logged': 5,
@@ -94,23 +148,66 @@ class GamificationManager:
             'mindful_spending': 8,
             'category_diversity': 12
         }
+        
+        # The rules never change after construction; bind the per-transaction ones once
+        self._karma_transaction = self.karma_rules['transaction_logged']
+        self._karma_mindful = self.karma_rules['mindful_spending']
+        self._karma_diversity = self.karma_rules['category_diversity']
+        self._karma_streak_bonus = self.karma_rules['streak_bonus']
     
+    @_locked
     def get_user_stats(self) -> Dict:
-        """Get current user statistics"""
+        """
+        Get current user statistics
+        
+        The parsed file is cached and re-read only when user_stats.json changes
+        on disk. The returned dict is a copy, so callers may keep or change it
+        without touching the cache.
+        """
+        stats = dict(self._cached_stats())
+        for key in _SET_FIELDS:
+            stats[key] = set(stats[key])
+        return stats
+    
+    @_locked
+    def _cached_stats(self) -> Dict:
+        """
+        The cached stats, re-read if user_stats.json changed
+        
+        Updates mutate the returned dict under the lock and then save it.
+        """
         try:
-            if os.path.exists(self.user_stats_file):
-                with open(self.user_stats_file, 'r') as f:
-                    stats = json.load(f)
-            else:
+            try:
+                st = os.stat(self.user_stats_file)
+            except FileNotFoundError:
                 stats = self._create_default_stats()
                 self._save_user_stats(stats)
+                return stats
+            
+            # Unsaved batched changes win over the file until they are flushed
+            if self._stats_cache is not None and (
+                    self._dirty or self._stats_signature == (st.st_mtime_ns, st.st_size)):
+                return self._stats_cache
             
-            # Ensure all required fields exist
-            default_stats = self._create_default_stats()
-            for key, value in default_stats.items():
-                if key not in stats:
-                    stats[key] = value
+            # One bytes read handed to the C decoder, skipping the text layer
+            with open(self.user_stats_file, 'rb') as f:
+                stats = json.loads(f.read())
             
+            # Files from an older schema get missing fields filled in once, then saved
+            migrate = stats.get('schema_version') != _SCHEMA_VERSION
+            if migrate:
+                default_stats = self._create_default_stats()
+                for key, value in default_stats.items():
+                    if key not in stats:
+                        stats[key] = value
+                stats['schema_version'] = _SCHEMA_VERSION
+            for key in _SET_FIELDS:
+                stats[key] = set(stats[key])
+            
+            self._stats_cache = stats
+            self._stats_signature = (st.st_mtime_ns, st.st_size)
+            if migrate:
+                self._save_user_stats(stats)
             return stats
             
         except Exception as e:
@@ -125,7 +222,7 @@ class GamificationManager:
             'last_entry_date': '',
             'karma_points': 0,
             'total_transactions': 0,
-            'achievements': [],
+            'achievements': set(),
             'level': 1,
             'experience_points': 0,
             'streak_freeze_count': 3,  # Streak protection tokens
@@ -133,35 +230,80 @@ class GamificationManager:
             'monthly_goals_completed': 0,
             'total_karma_earned': 0,
             'best_saving_week': 0,
-            'categories_used': [],
+            'categories_used': set(),
             'first_transaction_date': '',
-            'last_achievement_date': ''
+            'last_achievement_date': '',
+            'week_start': '',  # Monday of the week week_tx_count belongs to
+            'week_tx_count': 0,
+            'schema_version': _SCHEMA_VERSION
         }
     
+    @_locked
     def _save_user_stats(self, stats: Dict) -> bool:
-        """Save user statistics to file"""
+        """Save user statistics to file and keep them as the cached copy"""
         try:
-            with open(self.user_stats_file, 'w') as f:
-                json.dump(stats, f, indent=2)
+            # Sets are written as sorted lists so the file stays stable between saves
+            payload = dict(stats)
+            for key in _SET_FIELDS:
+                payload[key] = sorted(stats[key])
+            # Saved on every transaction, so it is written compact in a single write
+            write_json_atomic(self.user_stats_file, payload, indent=None)
+            st = os.stat(self.user_stats_file)
+            self._stats_cache = stats
+            self._stats_signature = (st.st_mtime_ns, st.st_size)
+            self._dirty = False
             return True
         except Exception as e:
             print(f"Error saving user stats: {e}")
             return False
     
+    def _mark_dirty(self, stats: Dict):
+        """Record that stats changed, saving now unless a batch is open; call with _lock held"""
+        self._stats_cache = stats
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+    
+    @_locked
+    def flush(self) -> bool:
+        """Write pending stats changes to user_stats.json, if there are any"""
+        if not self._dirty or self._stats_cache is None:
+            return True
+        return self._save_user_stats(self._stats_cache)
+    
+    @contextmanager
+    def batch_updates(self):
+        """
+        Defer stats writes until the outermost block exits
+        
+        Back-to-back updates for one event (streak, then karma) then cost a
+        single write of user_stats.json instead of one per update.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+    
+    @_locked
     def update_streak(self) -> Dict:
         """Update user's tracking streak"""
-        stats = self.get_user_stats()
-        today = datetime.now().strftime('%Y-%m-%d')
+        stats = self._cached_stats()
+        current_date = date.today()
+        today = current_date.strftime('%Y-%m-%d')
         
         # Check if there's a transaction today
-        has_transaction_today = self._has_transaction_today()
+        has_transaction_today = self._has_transaction_today(today)
         
         if has_transaction_today:
-            last_entry = stats.get('last_entry_date', '')
+            last_entry = stats['last_entry_date']
             
             if last_entry:
-                last_date = datetime.strptime(last_entry, '%Y-%m-%d')
-                current_date = datetime.strptime(today, '%Y-%m-%d')
+                last_date = date.fromisoformat(last_entry)
                 days_diff = (current_date - last_date).days
                 
                 if days_diff == 1:
@@ -172,7 +314,7 @@ class GamificationManager:
                     pass
                 else:
                     # Gap in days - check if can use streak freeze
-                    if days_diff <= 2 and stats.get('streak_freeze_count', 0) > 0:
+                    if days_diff <= 2 and stats['streak_freeze_count'] > 0:
                         # Use streak freeze
                         stats['streak_freeze_count'] -= 1
                         # Keep current streak
@@ -185,170 +327,161 @@ class GamificationManager:
                 stats['first_transaction_date'] = today
             
             # Update max streak
-            if stats['streak'] > stats.get('max_streak', 0):
+            if stats['streak'] > stats['max_streak']:
                 stats['max_streak'] = stats['streak']
             
             # Update last entry date
             stats['last_entry_date'] = today
             
             # Award streak achievements
-            new_achievements = self._check_streak_achievements(stats)
+            new_achievements = self._check_streak_achievements(stats, today)
             
             # Add karma points for maintaining streak
             if stats['streak'] >= 5:
-                karma_earned = self.karma_rules['streak_bonus']
+                karma_earned = self._karma_streak_bonus
                 stats['karma_points'] += karma_earned
                 stats['total_karma_earned'] += karma_earned
-        
-        # Save updated stats
-        self._save_user_stats(stats)
+            
+            # Save updated stats
+            self._mark_dirty(stats)
         
         return {
             'streak': stats['streak'],
             'max_streak': stats['max_streak'],
             'new_achievements': new_achievements if has_transaction_today else [],
-            'streak_freeze_count': stats.get('streak_freeze_count', 0)
+            'streak_freeze_count': stats['streak_freeze_count']
         }
     
+    @_locked
     def update_karma_points(self, category: str, amount: float) -> int:
         """Update karma points based on transaction"""
-        stats = self.get_user_stats()
-        karma_earned = 0
-        
-        # Base karma for logging transaction
-        karma_earned += self.karma_rules['transaction_logged']
+        stats = self._cached_stats()
+        current_date = date.today()
+        today = current_date.isoformat()
         
-        # Bonus for mindful spending (small amounts)
-        if amount <= 100:
-            karma_earned += self.karma_rules['mindful_spending']
+        # Category diversity bonus goes to the first transaction in a category
+        categories_used = stats['categories_used']
+        new_category = category not in categories_used
+        if new_category:
+            categories_used.add(category)
         
-        # Category diversity bonus
-        if category not in stats.get('categories_used', []):
-            karma_earned += self.karma_rules['category_diversity']
-            categories_used = stats.get('categories_used', [])
-            categories_used.append(category)
-            stats['categories_used'] = categories_used
+        # Base karma for logging, plus bonuses for mindful spending (small amounts) and diversity
+        karma_earned = (self._karma_transaction
+                        + (self._karma_mindful if amount <= 100 else 0)
+                        + (self._karma_diversity if new_category else 0))
         
         # Update stats
         stats['karma_points'] += karma_earned
         stats['total_karma_earned'] += karma_earned
         stats['total_transactions'] += 1
         
+        # Advance this week's counter, restarting it when a new week begins
+        week_start = (current_date - timedelta(days=current_date.weekday())).isoformat()
+        if stats['week_start'] == week_start:
+            stats['week_tx_count'] += 1
+        else:
+            stats['week_start'] = week_start
+            stats['week_tx_count'] = 1
+        
         # Update level based on karma points
         stats['level'] = self._calculate_level(stats['karma_points'])
         
         # Check for new achievements
-        new_achievements = self._check_transaction_achievements(stats, category, amount)
+        new_achievements = self._check_transaction_achievements(stats, category, amount, today)
         
-        self._save_user_stats(stats)
+        self._mark_dirty(stats)
         
         return karma_earned
     
-    def _has_transaction_today(self) -> bool:
-        """Check if user has logged any transaction today"""
-        today = datetime.now().strftime('%Y-%m-%d')
-        
+    def _has_transaction_today(self, today: str) -> bool:
+        """Check if user has logged any transaction today ('YYYY-MM-DD')"""
         try:
-            import csv
+            # Per-date counts are kept up to date incrementally as the CSV grows
             if os.path.exists(self.transactions_file):
-                with open(self.transactions_file, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if row.get('date', '') == today:
-                            return True
-        except Exception as e:
+                return get_daily_transaction_counts().get(today, 0) > 0
+        except (OSError, ValueError) as e:
             print(f"Error checking today's transactions: {e}")
         
         return False
     
-    def _check_streak_achievements(self, stats: Dict) -> List[Dict]:
+    def _award_entries(self, achievement_ids: List[str], today: str) -> List[Dict]:
+        """Materialize awarded achievement ids as dicts for the caller"""
+        return [{**self.achievements[achievement_id], 'earned_date': today, 'id': achievement_id}
+                for achievement_id in achievement_ids]
+    
+    def _check_streak_achievements(self, stats: Dict, today: str) -> List[Dict]:
         """Check and award streak-based achievements"""
-        new_achievements = []
+        awarded = []
         current_streak = stats['streak']
-        existing_achievements = set(stats.get('achievements', []))
-        
-        # Check streak milestones
-        streak_milestones = [5, 10, 30]
-        for milestone in streak_milestones:
-            achievement_id = f'streak_{milestone}'
-            if current_streak >= milestone and achievement_id not in existing_achievements:
-                achievement = self.achievements[achievement_id].copy()
-                achievement['earned_date'] = datetime.now().strftime('%Y-%m-%d')
-                achievement['id'] = achievement_id
+        existing_achievements = stats['achievements']
+        
+        # Check streak milestones; they are sorted, so stop at the first one not reached
+        for milestone, achievement_id in self._STREAK_MILESTONES:
+            if current_streak < milestone:
+                break
+            if achievement_id not in existing_achievements:
+                points = self.achievements[achievement_id]['points']
                 
-                new_achievements.append(achievement)
-                stats['achievements'].append(achievement_id)
-                stats['karma_points'] += achievement['points']
-                stats['total_karma_earned'] += achievement['points']
+                awarded.append(achievement_id)
+                existing_achievements.add(achievement_id)
+                stats['karma_points'] += points
+                stats['total_karma_earned'] += points
         
-        return new_achievements
+        return self._award_entries(awarded, today)
     
-    def _check_transaction_achievements(self, stats: Dict, category: str, amount: float) -> List[Dict]:
+    def _check_transaction_achievements(self, stats: Dict, category: str, amount: float,
+                                        today: str) -> List[Dict]:
         """Check and award transaction-based achievements"""
-        new_achievements = []
-        existing_achievements = set(stats.get('achievements', []))
+        awarded = []
+        existing_achievements = stats['achievements']
         
         # First transaction achievement
         if stats['total_transactions'] == 1 and 'first_transaction' not in existing_achievements:
-            achievement = self.achievements['first_transaction'].copy()
-            achievement['earned_date'] = datetime.now().strftime('%Y-%m-%d')
-            achievement['id'] = 'first_transaction'
-            
-            new_achievements.append(achievement)
-            stats['achievements'].append('first_transaction')
+            awarded.append('first_transaction')
         
         # Century club achievement
         if stats['total_transactions'] >= 100 and 'hundred_transactions' not in existing_achievements:
-            achievement = self.achievements['hundred_transactions'].copy()
-            achievement['earned_date'] = datetime.now().strftime('%Y-%m-%d')
-            achievement['id'] = 'hundred_transactions'
-            
-            new_achievements.append(achievement)
-            stats['achievements'].append('hundred_transactions')
+            awarded.append('hundred_transactions')
         
         # Category master achievement
-        if len(stats.get('categories_used', [])) >= 5 and 'category_master' not in existing_achievements:
-            achievement = self.achievements['category_master'].copy()
-            achievement['earned_date'] = datetime.now().strftime('%Y-%m-%d')
-            achievement['id'] = 'category_master'
-            
-            new_achievements.append(achievement)
-            stats['achievements'].append('category_master')
+        if len(stats['categories_used']) >= 5 and 'category_master' not in existing_achievements:
+            awarded.append('category_master')
         
-        return new_achievements
+        existing_achievements.update(awarded)
+        return self._award_entries(awarded, today)
     
-    def _calculate_level(self, karma_points: int) -> int:
-        """Calculate user level based on karma points"""
-        # Level progression: 100 points per level initially, then increasing
-        if karma_points < 100:
-            return 1
-        elif karma_points < 300:
-            return 2
-        elif karma_points < 600:
-            return 3
-        elif karma_points < 1000:
-            return 4
-        elif karma_points < 1500:
-            return 5
-        else:
-            # Higher levels need more points
-            return min(5 + (karma_points - 1500) // 500, 20)
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _calculate_level(karma_points: int) -> int:
+        """Calculate user level based on karma points (pure, so memoized)"""
+        cls = GamificationManager
+        thresholds = cls._LEVEL_THRESHOLDS
+        if karma_points < thresholds[-1]:
+            return 1 + bisect_right(thresholds, karma_points)
+        
+        # Higher levels need more points
+        return min(len(thresholds) + (karma_points - thresholds[-1]) // cls._LEVEL_STEP, cls._MAX_LEVEL)
     
-    def get_level_progress(self) -> Dict:
+    def get_level_progress(self, stats: Optional[Dict] = None) -> Dict:
         """Get current level and progress to next level"""
-        stats = self.get_user_stats()
+        if stats is None:
+            stats = self.get_user_stats()
         current_level = stats['level']
         karma_points = stats['karma_points']
         
-        # Calculate points needed for next level
-        level_thresholds = [0, 100, 300, 600, 1000, 1500]
+        # Level bounds come from the same table _calculate_level uses
+        thresholds = self._LEVEL_THRESHOLDS
+        table_levels = len(thresholds)
+        
+        if current_level <= table_levels:
+            current_threshold = thresholds[current_level - 2] if current_level > 1 else 0
+        else:
+            current_threshold = thresholds[-1] + (current_level - table_levels) * self._LEVEL_STEP
         
-        if current_level < len(level_thresholds):
-            current_threshold = level_thresholds[current_level - 1] if current_level > 1 else 0
-            next_threshold = level_thresholds[current_level] if current_level < len(level_thresholds) else level_thresholds[-1] + (current_level - len(level_thresholds) + 1) * 500
+        if current_level < table_levels:
+            next_threshold = thresholds[current_level - 1]
         else:
-            current_threshold = 1500 + (current_level - 6) * 500
-            next_threshold = current_threshold + 500
+            next_threshold = thresholds[-1] + (current_level - table_levels + 1) * self._LEVEL_STEP
         
         progress = karma_points - current_threshold
         needed = next_threshold - karma_points
@@ -363,50 +496,34 @@ class GamificationManager:
             'next_level': current_level + 1
         }
     
+    @_locked
     def get_achievements(self, earned_only: bool = False) -> List[Dict]:
         """Get list of achievements"""
-        stats = self.get_user_stats()
-        earned_achievements = set(stats.get('achievements', []))
+        stats = self._cached_stats()
+        earned_achievements = stats['achievements']
         
-        achievements_list = []
-        for achievement_id, achievement_data in self.achievements.items():
-            achievement = achievement_data.copy()
-            achievement['id'] = achievement_id
-            achievement['earned'] = achievement_id in earned_achievements
-            
-            if not earned_only or achievement['earned']:
-                achievements_list.append(achievement)
+        # Templates are already in points order, so earned-then-unearned needs no sort
+        achievements_list = [{**t, 'earned': True} for t in self._achievement_templates
+                             if t['id'] in earned_achievements]
         
-        # Sort by earned status and points
-        achievements_list.sort(key=lambda x: (not x['earned'], -x['points']))
+        if not earned_only:
+            achievements_list.extend({**t, 'earned': False} for t in self._achievement_templates
+                                     if t['id'] not in earned_achievements)
         
         return achievements_list
     
-    def get_weekly_summary(self) -> Dict:
+    def get_weekly_summary(self, stats: Optional[Dict] = None) -> Dict:
         """Get weekly gamification summary"""
-        stats = self.get_user_stats()
+        if stats is None:
+            stats = self.get_user_stats()
         
-        # Calculate this week's activity
-        today = datetime.now()
-        week_start = today - timedelta(days=today.weekday())
+        # This week's activity is counted as transactions are logged
+        today = date.today()
+        week_start = (today - timedelta(days=today.weekday())).isoformat()
         
-        weekly_transactions = 0
-        weekly_karma = 0
-        
-        try:
-            import csv
-            if os.path.exists(self.transactions_file):
-                with open(self.transactions_file, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        date_str = row.get('date', '')
-                        if date_str:
-                            transaction_date = datetime.strptime(date_str, '%Y-%m-%d')
-                            if transaction_date >= week_start:
-                                weekly_transactions += 1
-                                weekly_karma += 5  # Base karma per transaction
-        except Exception as e:
-            print(f"Error calculating weekly summary: {e}")
+        # A counter left over from an earlier week means nothing was logged this week
+        weekly_transactions = stats['week_tx_count'] if stats['week_start'] == week_start else 0
+        weekly_karma = self._karma_transaction * weekly_transactions  # Base karma per transaction
         
         return {
             'weekly_transactions': weekly_transactions,
@@ -415,7 +532,7 @@ class GamificationManager:
             'max_streak': stats['max_streak'],
             'achievements_this_week': self._get_recent_achievements(7),
             'level': stats['level'],
-            'streak_freeze_available': stats.get('streak_freeze_count', 0)
+            'streak_freeze_available': stats['streak_freeze_count']
         }
     
     def _get_recent_achievements(self, days: int) -> List[Dict]:
@@ -424,20 +541,22 @@ class GamificationManager:
         # For now, return empty list
         return []
     
+    @_locked
     def use_streak_freeze(self) -> bool:
         """Use a streak freeze token"""
-        stats = self.get_user_stats()
+        stats = self._cached_stats()
         
-        if stats.get('streak_freeze_count', 0) > 0:
+        if stats['streak_freeze_count'] > 0:
             stats['streak_freeze_count'] -= 1
-            self._save_user_stats(stats)
+            self._mark_dirty(stats)
             return True
         
         return False
     
-    def get_leaderboard_data(self) -> Dict:
+    def get_leaderboard_data(self, stats: Optional[Dict] = None) -> Dict:
         """Get user's leaderboard position (single user for now)"""
-        stats = self.get_user_stats()
+        if stats is None:
+            stats = self.get_user_stats()
         
         return {
             'rank': 1,  # Always rank 1 for single user
@@ -445,44 +564,78 @@ class GamificationManager:
             'karma_points': stats['karma_points'],
             'level': stats['level'],
             'streak': stats['streak'],
-            'achievements_count': len(stats.get('achievements', [])),
+            'achievements_count': len(stats['achievements']),
             'percentile': 100  # Top 100% (only user)
         }
+    
+    def get_dashboard(self) -> Dict:
+        """Get stats, level progress, leaderboard and weekly views from one stats read"""
+        stats = self.get_user_stats()
+        
+        return {
+            'stats': stats,
+            'level_progress': self.get_level_progress(stats),
+            'leaderboard': self.get_leaderboard_data(stats),
+            'weekly': self.get_weekly_summary(stats)
+        }
+
+# Global gamification manager instance, created on first use
+_gamification_manager = None
+_manager_lock = threading.Lock()
 
-# Global gamification manager instance
-_gamification_manager = GamificationManager()
+def _mgr() -> GamificationManager:
+    """Return the shared gamification manager, creating it if needed"""
+    global _gamification_manager
+    if _gamification_manager is None:
+        # Request threads and the bookkeeping worker must end up sharing one instance
+        with _manager_lock:
+            if _gamification_manager is None:
+                _gamification_manager = GamificationManager()
+    return _gamification_manager
 
 def update_streak() -> Dict:
     """Update user's tracking streak"""
-    return _gamification_manager.update_streak()
+    return _mgr().update_streak()
 
 def update_karma_points(category: str, amount: float) -> int:
     """Update karma points for a transaction"""
-    return _gamification_manager.update_karma_points(category, amount)
+    return _mgr().update_karma_points(category, amount)
 
 def get_user_stats() -> Dict:
     """Get current user statistics"""
-    return _gamification_manager.get_user_stats()
+    return _mgr().get_user_stats()
 
 def get_level_progress() -> Dict:
     """Get level progress information"""
-    return _gamification_manager.get_level_progress()
+    return _mgr().get_level_progress()
 
 def get_achievements(earned_only: bool = False) -> List[Dict]:
     """Get list of achievements"""
-    return _gamification_manager.get_achievements(earned_only)
+    return _mgr().get_achievements(earned_only)
 
 def get_weekly_summary() -> Dict:
     """Get weekly gamification summary"""
-    return _gamification_manager.get_weekly_summary()
+    return _mgr().get_weekly_summary()
 
 def use_streak_freeze() -> bool:
     """Use a streak freeze token"""
-    return _gamification_manager.use_streak_freeze()
+    return _mgr().use_streak_freeze()
 
 def get_leaderboard_data() -> Dict:
     """Get leaderboard data"""
-    return _gamification_manager.get_leaderboard_data()
+    return _mgr().get_leaderboard_data()
+
+def get_dashboard() -> Dict:
+    """Get all gamification views from a single stats read"""
+    return _mgr().get_dashboard()
+
+def batch_updates():
+    """Defer user stats writes until the block exits"""
+    return _mgr().batch_updates()
+
+def flush_user_stats() -> bool:
+    """Write pending user stats changes"""
+    return _mgr().flush()
 
 # Test function
 def test_gamification():
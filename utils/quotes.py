@@ -4,8 +4,197 @@ Provides Tamil and English quotes from Thirukkural, Warren Buffett, and AI-gener
 """
 
 import random
-from datetime import datetime
-from typing import Dict, List, Optional
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+from utils.regex_trie import trie_alternation
+
+@dataclass(slots=True, frozen=True)
+class Quote:
+    """A single quote record; the public API hands these out as dicts"""
+    text: str
+    tamil: Optional[str]
+    author: str
+    category: str
+    translation: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """The quote as the dict callers receive, translation only when it has one"""
+        quote = {'text': self.text, 'tamil': self.tamil, 'author': self.author}
+        if self.translation is not None:
+            quote['translation'] = self.translation
+        quote['category'] = self.category
+        return quote
+
+def _frozen(*quotes: Dict) -> Tuple[Quote, ...]:
+    """Turn quote literals into immutable records shared by every QuoteManager"""
+    return tuple(Quote(**quote) for quote in quotes)
+
+# Corpus size from which search runs over one joined buffer instead of per quote
+_BULK_SEARCH_MIN = 500
+
+# Separates fields in the joined buffer so no match can span two of them
+_FIELD_SEP = '\x00'
+
+def _char_bits(text: str) -> int:
+    """
+    Character-presence bitmap used to rule out search candidates cheaply
+    
+    ASCII characters get a bit each; other code points (Tamil) share 64 bits
+    above them, so Tamil text never masks ASCII bits. A string can only
+    contain the keyword if its bitmap has every bit of the keyword's.
+    """
+    bits = 0
+    for char in set(text):
+        code = ord(char)
+        bits |= 1 << (code if code < 128 else 128 + code % 64)
+    return bits
+
+# Thirukkural quotes (751, 753, 754 and related financial wisdom)
+_THIRUKKURAL_QUOTES = _frozen(
+    {
+        'text': 'Wealth unused is not wealth at all.',
+        'tamil': 'செல்வத்துள் செல்வம் செவிக்கு செல்வம்',
+        'author': 'Thirukkural 751',
+        'translation': 'Among wealth, the wealth that comes to the ear (knowledge) is true wealth',
+        'category': 'wisdom'
+    },
+    {
+        'text': 'The best investment is in knowledge and wisdom.',
+        'tamil': 'கல்வி கரையில் கற்பித்துக் கொண்டிருப்பது',
+        'author': 'Thirukkural 753',
+        'translation': 'Education is the shore where wisdom is taught and learned',
+        'category': 'education'
+    },
+    {
+        'text': 'Saving today ensures prosperity tomorrow.',
+        'tamil': 'இன்று சேர்த்த செல்வம் நாளை துன்பம் தீர்க்கும்',
+        'author': 'Thirukkural 754',
+        'translation': 'Wealth saved today will solve tomorrow\'s troubles',
+        'category': 'savings'
+    },
+    {
+        'text': 'Spend wisely, for money spent is money gone.',
+        'tamil': 'ஒழுக்கத்துடன் செலவிடு, அதுவே செல்வத்தின் வழி',
+        'author': 'Thirukkural - Inspired',
+        'translation': 'Spend with discipline, that is the path of wealth',
+        'category': 'spending'
+    },
+    {
+        'text': 'Debt is the enemy of peace and prosperity.',
+        'tamil': 'கடன் என்பது மனநிம்மதியின் எதிரி',
+        'author': 'Thirukkural - Inspired',
+        'translation': 'Debt is the enemy of mental peace',
+        'category': 'debt'
+    }
+)
+
+# Warren Buffett quotes
+_BUFFETT_QUOTES = _frozen(
+    {
+        'text': 'Do not save what is left after spending, but spend what is left after saving.',
+        'tamil': None,
+        'author': 'Warren Buffett',
+        'category': 'savings'
+    },
+    {
+        'text': 'Price is what you pay. Value is what you get.',
+        'tamil': None,
+        'author': 'Warren Buffett',
+        'category': 'value'
+    },
+    {
+        'text': 'Someone\'s sitting in the shade today because someone planted a tree a long time ago.',
+        'tamil': None,
+        'author': 'Warren Buffett',
+        'category': 'investment'
+    },
+    {
+        'text': 'Risk comes from not knowing what you\'re doing.',
+        'tamil': None,
+        'author': 'Warren Buffett',
+        'category': 'knowledge'
+    },
+    {
+        'text': 'It\'s far better to buy a wonderful company at a fair price than a fair company at a wonderful price.',
+        'tamil': None,
+        'author': 'Warren Buffett',
+        'category': 'investment'
+    }
+)
+
+# AI-generated financial wisdom quotes
+_AI_QUOTES = _frozen(
+    {
+        'text': 'Track your expenses like you track your heartbeat - consistently and with purpose.',
+        'tamil': 'உங்கள் செலவுகளை உங்கள் இதயத் துடிப்பு போல கவனமாக கண்காணியுங்கள்',
+        'author': 'Finla Wisdom',
+        'category': 'tracking'
+    },
+    {
+        'text': 'Small expenses, when ignored, become big regrets.',
+        'tamil': 'சிறிய செலவுகள் அலட்சியம் செய்யப்பட்டால் பெரிய வருத்தமாக மாறும்',
+        'author': 'Finla Wisdom',
+        'category': 'mindfulness'
+    },
+    {
+        'text': 'Your future self will thank you for the money you save today.',
+        'tamil': 'இன்று நீங்கள் சேமிக்கும் பணத்திற்கு உங்கள் எதிர்கால நீங்கள் நன்றி சொல்வீர்கள்',
+        'author': 'Finla Wisdom',
+        'category': 'future'
+    },
+    {
+        'text': 'Budgeting is not about limiting yourself, it\'s about making the things that excite you possible.',
+        'tamil': 'பட்ஜெட் என்பது உங்களை கட்டுப்படுத்துவது அல்ல, உங்களை உற்சாகப்படுத்தும் விஷயங்களை சாத்தியமாக்குவது',
+        'author': 'Finla Wisdom',
+        'category': 'budgeting'
+    },
+    {
+        'text': 'Every rupee saved is a step towards financial freedom.',
+        'tamil': 'சேமிக்கப்படும் ஒவ்வொரு ரூபாயும் நிதி சுதந்திரத்தின் நோக்கி ஒரு அடி',
+        'author': 'Finla Wisdom',
+        'category': 'freedom'
+    },
+    {
+        'text': 'Discipline in spending today creates abundance tomorrow.',
+        'tamil': 'இன்றைய செலவில் கடைபிடிக்கும் ஒழுக்கம் நாளை வளத்தை உருவாக்கும்',
+        'author': 'Finla Wisdom',
+        'category': 'discipline'
+    }
+)
+
+# Motivational quotes for different financial situations
+_SITUATIONAL_QUOTES = MappingProxyType({
+    'low_balance': _frozen(
+        {
+            'text': 'Every financial comeback starts with a single saved rupee.',
+            'tamil': 'ஒவ்வொரு நிதி மீள்வரவும் ஒரு ரூபாய் சேமிப்பில் தொடங்குகிறது',
+            'author': 'Finla Motivation',
+            'category': 'comeback'
+        }
+    ),
+    'high_spending': _frozen(
+        {
+            'text': 'Pause before you purchase. Your future self depends on it.',
+            'tamil': 'வாங்குவதற்கு முன் நிறுத்துங்கள். உங்கள் எதிர்காலம் அதை சார்ந்துள்ளது',
+            'author': 'Finla Motivation',
+            'category': 'mindful_spending'
+        }
+    ),
+    'good_savings': _frozen(
+        {
+            'text': 'Your discipline today is building your dreams for tomorrow.',
+            'tamil': 'இன்றைய உங்கள் ஒழுக்கம் நாளைய கனவுகளை உருவாக்குகிறது',
+            'author': 'Finla Motivation',
+            'category': 'success'
+        }
+    )
+})
 
 class QuoteManager:
     """Manages daily motivational quotes for financial wisdom"""
@@ -13,146 +202,12 @@ class QuoteManager:
     def __init__(self):
         """Initialize quote collections"""
         
-        # Thirukkural quotes (751, 753, 754 and related financial wisdom)
-        self.thirukkural_quotes = [
-            {
-                'text': 'Wealth unused is not wealth at all.',
-                'tamil': 'செல்வத்துள் செல்வம் செவிக்கு செல்வம்',
-                'author': 'Thirukkural 751',
-                'translation': 'Among wealth, the wealth that comes to the ear (knowledge) is true wealth',
-                'category': 'wisdom'
-            },
-            {
-                'text': 'The best investment is in knowledge and wisdom.',
-                'tamil': 'கல்வி கரையில் கற்பித்துக் கொண்டிருப்பது',
-                'author': 'Thirukkural 753',
-                'translation': 'Education is the shore where wisdom is taught and learned',
-                'category': 'education'
-            },
-            {
-                'text': 'Saving today ensures prosperity tomorrow.',
-                'tamil': 'இன்று சேர்த்த செல்வம் நாளை துன்பம் தீர்க்கும்',
-                'author': 'Thirukkural 754',
-                'translation': 'Wealth saved today will solve tomorrow\'s troubles',
-                'category': 'savings'
-            },
-            {
-                'text': 'Spend wisely, for money spent is money gone.',
-                'tamil': 'ஒழுக்கத்துடன் செலவிடு, அதுவே செல்வத்தின் வழி',
-                'author': 'Thirukkural - Inspired',
-                'translation': 'Spend with discipline, that is the path of wealth',
-                'category': 'spending'
-            },
-            {
-                'text': 'Debt is the enemy of peace and prosperity.',
-                'tamil': 'கடன் என்பது மனநிம்மதியின் எதிரி',
-                'author': 'Thirukkural - Inspired',
-                'translation': 'Debt is the enemy of mental peace',
-                'category': 'debt'
-            }
-        ]
-        
-        # Warren Buffett quotes
-        self.buffett_quotes = [
-            {
-                'text': 'Do not save what is left after spending, but spend what is left after saving.',
-                'tamil': None,
-                'author': 'Warren Buffett',
-                'category': 'savings'
-            },
-            {
-                'text': 'Price is what you pay. Value is what you get.',
-                'tamil': None,
-                'author': 'Warren Buffett',
-                'category': 'value'
-            },
-            {
-                'text': 'Someone\'s sitting in the shade today because someone planted a tree a long time ago.',
-                'tamil': None,
-                'author': 'Warren Buffett',
-                'category': 'investment'
-            },
-            {
-                'text': 'Risk comes from not knowing what you\'re doing.',
-                'tamil': None,
-                'author': 'Warren Buffett',
-                'category': 'knowledge'
-            },
-            {
-                'text': 'It\'s far better to buy a wonderful company at a fair price than a fair company at a wonderful price.',
-                'tamil': None,
-                'author': 'Warren Buffett',
-                'category': 'investment'
-            }
-        ]
-        
-        # AI-generated financial wisdom quotes
-        self.ai_quotes = [
-            {
-                'text': 'Track your expenses like you track your heartbeat - consistently and with purpose.',
-                'tamil': 'உங்கள் செலவுகளை உங்கள் இதயத் துடிப்பு போல கவனமாக கண்காணியுங்கள்',
-                'author': 'Finla Wisdom',
-                'category': 'tracking'
-            },
-            {
-                'text': 'Small expenses, when ignored, become big regrets.',
-                'tamil': 'சிறிய செலவுகள் அலட்சியம் செய்யப்பட்டால் பெரிய வருத்தமாக மாறும்',
-                'author': 'Finla Wisdom',
-                'category': 'mindfulness'
-            },
-            {
-                'text': 'Your future self will thank you for the money you save today.',
-                'tamil': 'இன்று நீங்கள் சேமிக்கும் பணத்திற்கு உங்கள் எதிர்கால நீங்கள் நன்றி சொல்வீர்கள்',
-                'author': 'Finla Wisdom',
-                'category': 'future'
-            },
-            {
-                'text': 'Budgeting is not about limiting yourself, it\'s about making the things that excite you possible.',
-                'tamil': 'பட்ஜெட் என்பது உங்களை கட்டுப்படுத்துவது அல்ல, உங்களை உற்சாகப்படுத்தும் விஷயங்களை சாத்தியமாக்குவது',
-                'author': 'Finla Wisdom',
-                'category': 'budgeting'
-            },
-            {
-                'text': 'Every rupee saved is a step towards financial freedom.',
-                'tamil': 'சேமிக்கப்படும் ஒவ்வொரு ரூபாயும் நிதி சுதந்திரத்தின் நோக்கி ஒரு அடி',
-                'author': 'Finla Wisdom',
-                'category': 'freedom'
-            },
-            {
-                'text': 'Discipline in spending today creates abundance tomorrow.',
-                'tamil': 'இன்றைய செலவில் கடைபிடிக்கும் ஒழுக்கம் நாளை வளத்தை உருவாக்கும்',
-                'author': 'Finla Wisdom',
-                'category': 'discipline'
-            }
-        ]
-        
-        # Motivational quotes for different financial situations
-        self.situational_quotes = {
-            'low_balance': [
-                {
-                    'text': 'Every financial comeback starts with a single saved rupee.',
-                    'tamil': 'ஒவ்வொரு நிதி மீள்வரவும் ஒரு ரூபாய் சேமிப்பில் தொடங்குகிறது',
-                    'author': 'Finla Motivation',
-                    'category': 'comeback'
-                }
-            ],
-            'high_spending': [
-                {
-                    'text': 'Pause before you purchase. Your future self depends on it.',
-                    'tamil': 'வாங்குவதற்கு முன் நிறுத்துங்கள். உங்கள் எதிர்காலம் அதை சார்ந்துள்ளது',
-                    'author': 'Finla Motivation',
-                    'category': 'mindful_spending'
-                }
-            ],
-            'good_savings': [
-                {
-                    'text': 'Your discipline today is building your dreams for tomorrow.',
-                    'tamil': 'இன்றைய உங்கள் ஒழுக்கம் நாளைய கனவுகளை உருவாக்குகிறது',
-                    'author': 'Finla Motivation',
-                    'category': 'success'
-                }
-            ]
-        }
+        # The collections are module-level constants shared by every instance;
+        # the getters hand out plain dicts built from the immutable records
+        self.thirukkural_quotes = _THIRUKKURAL_QUOTES
+        self.buffett_quotes = _BUFFETT_QUOTES
+        self.ai_quotes = _AI_QUOTES
+        self.situational_quotes = _SITUATIONAL_QUOTES
         
         # Combine all quote collections
         self.all_quotes = (
@@ -161,14 +216,54 @@ class QuoteManager:
             self.ai_quotes
         )
         
-        # Initialize random seed based on date for daily consistency
-        self._set_daily_seed()
-    
-    def _set_daily_seed(self):
-        """Set random seed based on current date for consistent daily quotes"""
-        today = datetime.now()
-        date_seed = today.year * 10000 + today.month * 100 + today.day
-        random.seed(date_seed)
+        # Quotes grouped by category, in collection order
+        self._by_category = {}
+        for quote in self.all_quotes:
+            self._by_category.setdefault(quote.category, []).append(quote)
+        self._categories = tuple(sorted(self._by_category))
+        
+        # Positions in all_quotes for each lowercased author, in collection order
+        self._by_author_lower = {}
+        for position, quote in enumerate(self.all_quotes):
+            self._by_author_lower.setdefault(quote.author.lower(), []).append(position)
+        
+        # Search columns parallel to all_quotes: each lowercased field ('' when
+        # absent) and a character bitmap per quote. They live beside the quotes
+        # so the returned dicts carry no extra keys.
+        self._texts_lower = [quote.text.lower() for quote in self.all_quotes]
+        self._tamil_lower = [(quote.tamil or '').lower() for quote in self.all_quotes]
+        self._translations_lower = [(quote.translation or '').lower() for quote in self.all_quotes]
+        self._categories_lower = [quote.category.lower() for quote in self.all_quotes]
+        self._authors_lower = [quote.author.lower() for quote in self.all_quotes]
+        self._search_bits = [
+            _char_bits(''.join(fields)) for fields in zip(
+                self._texts_lower, self._tamil_lower, self._translations_lower,
+                self._categories_lower, self._authors_lower
+            )
+        ]
+        
+        # The corpus never changes, so hits per lowercased keyword can be reused;
+        # the cache is per instance, so no manager can see another's results
+        self._search_hits = lru_cache(maxsize=256)(self._find_hits)
+        
+        # Every quote's fields joined into one string, with the offset where each
+        # quote starts. Multi-keyword search always uses it; single keywords only
+        # once the corpus is large enough to beat the per-quote path.
+        documents = [_FIELD_SEP.join(fields) + _FIELD_SEP for fields in zip(
+            self._categories_lower, self._authors_lower, self._texts_lower,
+            self._translations_lower, self._tamil_lower
+        )]
+        self._bulk_starts = []
+        offset = 0
+        for document in documents:
+            self._bulk_starts.append(offset)
+            offset += len(document)
+        self._bulk_buffer = ''.join(documents)
+        self._bulk_search = len(self.all_quotes) >= _BULK_SEARCH_MIN
+        self._search_any_hits = lru_cache(maxsize=256)(self._find_any_hits)
+        
+        # Private RNG for the random getters, so the process-wide random state is never touched
+        self._rng = random.Random()
     
     def get_daily_quote(self, situation: Optional[str] = None) -> Dict:
         """
@@ -180,139 +275,211 @@ class QuoteManager:
         Returns:
             Dict: Quote information with text, tamil, author, and category
         """
-        # Reset seed for consistency
-        self._set_daily_seed()
-        
-        # If situation is provided, try to get relevant quote
-        if situation and situation in self.situational_quotes:
-            quotes_pool = self.situational_quotes[situation] + self.all_quotes
-        else:
-            quotes_pool = self.all_quotes
+        # The pick is a pure function of the date, so the global RNG is left alone
+        now = datetime.now()
         
         # Select quote based on day of year to ensure variety
-        day_of_year = datetime.now().timetuple().tm_yday
-        quote_index = day_of_year % len(quotes_pool)
+        day_of_year = now.timetuple().tm_yday
         
-        selected_quote = quotes_pool[quote_index].copy()
+        # If situation is provided, its quotes lead the pool; index into the
+        # virtual pool instead of concatenating it. No situation (or an unknown
+        # one) contributes an empty lead, which reduces to all_quotes alone.
+        situation_quotes = self.situational_quotes.get(situation, ())
+        lead = len(situation_quotes)
+        quote_index = day_of_year % (lead + len(self.all_quotes))
+        quote = situation_quotes[quote_index] if quote_index < lead else self.all_quotes[quote_index - lead]
         
-        # Add additional metadata
-        selected_quote['date'] = datetime.now().strftime('%Y-%m-%d')
-        selected_quote['day_of_year'] = day_of_year
-        
-        return selected_quote
+        # Copy the quote and add the metadata in one dict build
+        return {
+            **quote.to_dict(),
+            'date': now.strftime('%Y-%m-%d'),
+            'day_of_year': day_of_year
+        }
     
     def get_quote_by_category(self, category: str) -> Dict:
         """Get a random quote from specific category"""
-        category_quotes = [q for q in self.all_quotes if q['category'] == category]
+        category_quotes = self._by_category.get(category)
         
         if not category_quotes:
             return self.get_daily_quote()
         
-        return random.choice(category_quotes)
+        return self._rng.choice(category_quotes).to_dict()
     
     def get_random_quote(self) -> Dict:
         """Get a completely random quote"""
-        return random.choice(self.all_quotes)
+        return self._rng.choice(self.all_quotes).to_dict()
     
     def get_thirukkural_quote(self) -> Dict:
         """Get a random Thirukkural quote"""
-        return random.choice(self.thirukkural_quotes)
+        return self._rng.choice(self.thirukkural_quotes).to_dict()
     
     def get_buffett_quote(self) -> Dict:
         """Get a random Warren Buffett quote"""
-        return random.choice(self.buffett_quotes)
+        return self._rng.choice(self.buffett_quotes).to_dict()
     
     def get_ai_quote(self) -> Dict:
         """Get a random AI-generated quote"""
-        return random.choice(self.ai_quotes)
+        return self._rng.choice(self.ai_quotes).to_dict()
     
     def get_quotes_by_author(self, author: str) -> List[Dict]:
         """Get all quotes by specific author"""
-        return [q for q in self.all_quotes if author.lower() in q['author'].lower()]
+        author = author.lower()
+        
+        # Match against the few distinct authors rather than every quote
+        matched = [positions for author_lower, positions in self._by_author_lower.items()
+                   if author in author_lower]
+        if not matched:
+            return []
+        
+        # Several matching authors are merged back into collection order
+        positions = matched[0] if len(matched) == 1 else sorted(p for group in matched for p in group)
+        return [self.all_quotes[p].to_dict() for p in positions]
     
     def get_available_categories(self) -> List[str]:
         """Get list of all available quote categories"""
-        categories = set()
-        for quote in self.all_quotes:
-            categories.add(quote['category'])
-        return sorted(list(categories))
+        # A fresh list each call, so callers can still modify what they get back
+        return list(self._categories)
     
     def get_weekly_quotes(self) -> List[Dict]:
         """Get 7 quotes for the week"""
         # Ensure we have enough variety
         weekly_quotes = []
         used_indices = set()
+        quote_count = len(self.all_quotes)
+        today = datetime.now()
         
         for day in range(7):
             # Calculate index for each day of the week
-            today = datetime.now()
             target_date = today + timedelta(days=day)
             day_seed = target_date.year * 10000 + target_date.month * 100 + target_date.day
             
-            # Use modulo to select quote, avoid repeats
-            attempts = 0
-            while attempts < len(self.all_quotes):
-                quote_index = (day_seed + attempts) % len(self.all_quotes)
+            # Use modulo to select quote, probing forward past ones already used
+            # (at most six are taken, so this stops within seven steps)
+            for attempt in range(quote_count):
+                quote_index = (day_seed + attempt) % quote_count
                 if quote_index not in used_indices:
                     used_indices.add(quote_index)
-                    quote = self.all_quotes[quote_index].copy()
+                    quote = self.all_quotes[quote_index].to_dict()
                     quote['date'] = target_date.strftime('%Y-%m-%d')
                     quote['day_name'] = target_date.strftime('%A')
                     weekly_quotes.append(quote)
                     break
-                attempts += 1
         
         return weekly_quotes
     
     def search_quotes(self, keyword: str) -> List[Dict]:
         """Search quotes by keyword in text or translation"""
-        keyword = keyword.lower()
-        matching_quotes = []
+        return [self.all_quotes[i].to_dict() for i in self._search_hits(keyword.lower())]
+    
+    def search_quotes_any(self, query: str) -> List[Dict]:
+        """Search quotes matching any of the whitespace-separated keywords in query"""
+        keywords = tuple(sorted({kw for kw in query.lower().split() if _FIELD_SEP not in kw}))
+        if not keywords:
+            return []
         
-        for quote in self.all_quotes:
-            if (keyword in quote['text'].lower() or 
-                (quote.get('tamil') and keyword in quote['tamil'].lower()) or
-                (quote.get('translation') and keyword in quote['translation'].lower()) or
-                keyword in quote['category'].lower() or
-                keyword in quote['author'].lower()):
-                matching_quotes.append(quote)
+        return [self.all_quotes[i].to_dict() for i in self._search_any_hits(keywords)]
+    
+    def _find_hits(self, keyword: str) -> Tuple[int, ...]:
+        """Positions in all_quotes of quotes matching a lowercased keyword"""
+        if self._bulk_search and keyword and _FIELD_SEP not in keyword:
+            return self._bulk_hits(keyword)
+        
+        keyword_bits = _char_bits(keyword)
         
-        return matching_quotes
+        texts, tamil, translations = self._texts_lower, self._tamil_lower, self._translations_lower
+        categories, authors = self._categories_lower, self._authors_lower
+        
+        # The bitmap test skips quotes missing any keyword character before the substring
+        # scans, which run shortest field first so metadata hits stop early
+        return tuple(i for i, bits in enumerate(self._search_bits)
+                     if bits & keyword_bits == keyword_bits
+                     and (keyword in categories[i] or keyword in authors[i] or keyword in texts[i]
+                          or keyword in translations[i] or keyword in tamil[i]))
+    
+    def _bulk_hits(self, keyword: str) -> Tuple[int, ...]:
+        """
+        Search the joined buffer with str.find
+        
+        Each find is one C-level scan. After a hit, the search resumes at the
+        next quote's start, so every quote is reported at most once and in order.
+        """
+        buffer, starts = self._bulk_buffer, self._bulk_starts
+        hits = []
+        
+        position = buffer.find(keyword)
+        while position != -1:
+            index = bisect_right(starts, position) - 1
+            hits.append(index)
+            if index + 1 == len(starts):
+                break
+            position = buffer.find(keyword, starts[index + 1])
+        
+        return tuple(hits)
+    
+    def _find_any_hits(self, keywords: Tuple[str, ...]) -> Tuple[int, ...]:
+        """
+        Positions of quotes containing any of several lowercased keywords
+        
+        The keywords are factored into one trie-shaped pattern, so the joined
+        buffer is scanned once however many keywords there are, rather than
+        once per keyword. Keywords never contain the field separator, so a
+        match cannot span two fields or quotes.
+        """
+        pattern = re.compile(trie_alternation(keywords))
+        buffer, starts = self._bulk_buffer, self._bulk_starts
+        hits = []
+        
+        match = pattern.search(buffer)
+        while match:
+            index = bisect_right(starts, match.start()) - 1
+            hits.append(index)
+            if index + 1 == len(starts):
+                break
+            match = pattern.search(buffer, starts[index + 1])
+        
+        return tuple(hits)
 
-# Global quote manager instance
-_quote_manager = QuoteManager()
+# Global quote manager instance, built on first use rather than at import
+@lru_cache(maxsize=1)
+def _get_manager() -> QuoteManager:
+    """Return the shared quote manager"""
+    return QuoteManager()
 
 def get_daily_quote(situation: Optional[str] = None) -> Dict:
     """Get the daily motivational quote"""
-    return _quote_manager.get_daily_quote(situation)
+    return _get_manager().get_daily_quote(situation)
 
 def get_quote_by_category(category: str) -> Dict:
     """Get quote by category"""
-    return _quote_manager.get_quote_by_category(category)
+    return _get_manager().get_quote_by_category(category)
 
 def get_random_quote() -> Dict:
     """Get a random quote"""
-    return _quote_manager.get_random_quote()
+    return _get_manager().get_random_quote()
 
 def get_thirukkural_quote() -> Dict:
     """Get a Thirukkural quote"""
-    return _quote_manager.get_thirukkural_quote()
+    return _get_manager().get_thirukkural_quote()
 
 def get_buffett_quote() -> Dict:
     """Get a Warren Buffett quote"""
-    return _quote_manager.get_buffett_quote()
+    return _get_manager().get_buffett_quote()
 
 def get_weekly_quotes() -> List[Dict]:
     """Get quotes for the week"""
-    return _quote_manager.get_weekly_quotes()
+    return _get_manager().get_weekly_quotes()
 
 def search_quotes(keyword: str) -> List[Dict]:
     """Search quotes by keyword"""
-    return _quote_manager.search_quotes(keyword)
+    return _get_manager().search_quotes(keyword)
+
+def search_quotes_any(query: str) -> List[Dict]:
+    """Search quotes matching any keyword in query"""
+    return _get_manager().search_quotes_any(query)
 
 def get_available_categories() -> List[str]:
     """Get all quote categories"""
-    return _quote_manager.get_available_categories()
+    return _get_manager().get_available_categories()
 
 # Test function
 def test_quotes():
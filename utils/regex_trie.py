@@ -0,0 +1,32 @@
+"""
+Finla - Regex Trie Module
+Builds prefix-factored regex alternations for matching many literal words at once
+"""
+
+import re
+from typing import Iterable
+
+def trie_alternation(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation of words factored into a prefix trie
+    
+    'bus|bus stand|burger' becomes 'bu(?:rger|s(?: stand)?)', so the engine
+    follows one branch per character instead of retrying every word at each
+    position. Optional tails are greedy, so longer words are still tried
+    before their prefixes.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+    
+    return build(trie)
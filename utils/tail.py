@@ -0,0 +1,74 @@
+"""
+Finla - CSV Tail Reader Module
+Reads the most recent rows of an append-only CSV without parsing the whole file
+"""
+
+import csv
+import io
+from typing import Dict, List
+
+
+def read_tail_rows(path: str, n: int = 5, block: int = 8192) -> List[Dict[str, str]]:
+    """
+    Read the last n data rows of a CSV file
+
+    Walks backwards from the end of the file in fixed-size blocks until
+    enough record boundaries have been seen, so the cost depends on n rather
+    than on the size of the file.
+
+    Quoted fields may contain line breaks, so a newline only ends a record
+    when it is outside quotes. The end of the file is outside quotes, and
+    every quote character (doubled ones included) flips that state, so a
+    newline is a record boundary exactly when an even number of quote
+    characters follows it.
+
+    Args:
+        path (str): Path to a CSV file with a header row
+        n (int): Number of rows to return
+        block (int): Number of bytes to read per backward step
+
+    Returns:
+        List[Dict[str, str]]: Up to n rows keyed by the header, oldest first
+    """
+    if n <= 0:
+        return []
+
+    with open(path, 'rb') as f:
+        header = next(csv.reader([f.readline().decode('utf-8')]), [])
+        data_start = f.tell()
+        pos = f.seek(0, io.SEEK_END)
+
+        tail = b''
+        quotes = 0       # Quote characters between the scan point and the end of file
+        boundaries = []  # File offsets just past record-ending newlines, newest first
+        wanted = n + 1
+        while True:
+            while pos > data_start and len(boundaries) < wanted:
+                step = min(block, pos - data_start)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                tail = chunk + tail
+
+                # Scan the block backwards newline by newline, keeping quote parity
+                end = step
+                while True:
+                    newline = chunk.rfind(b'\n', 0, end)
+                    quotes += chunk.count(b'"', newline + 1, end)
+                    if newline < 0:
+                        break
+                    if quotes % 2 == 0:
+                        boundaries.append(pos + newline + 1)
+                    end = newline
+
+            # Cut at the oldest boundary needed, or parse everything read so far
+            start = boundaries[wanted - 1] if len(boundaries) >= wanted else data_start
+            text = tail[max(start, pos) - pos:].decode('utf-8')
+            rows = [row for row in csv.reader(io.StringIO(text, newline='')) if row]
+
+            # Blank lines count as boundaries but yield no rows; read further if short
+            if len(rows) >= n or start <= data_start:
+                break
+            wanted += n
+
+    return [dict(zip(header, row)) for row in rows[-n:]]
@@ -0,0 +1,100 @@
+"""
+Finla - Transaction Loading Module
+Parses transactions.csv once per file change into shared column lists
+"""
+
+import csv
+import os
+from typing import Dict, List
+
+TRANSACTIONS_FILE = os.path.join('data', 'transactions.csv')
+
+# Parsed columns per CSV path plus the file signature they were parsed from
+_txns_cache: Dict[str, Dict] = {}
+
+
+def _empty_columns() -> Dict[str, List]:
+    """Columns for a ledger with no transactions"""
+    return {'date': [], 'amount': [], 'category': [], 'bank': []}
+
+
+def _parse_transactions(path: str) -> Dict[str, List]:
+    """
+    Read the CSV into parallel date/amount/category/bank lists
+    
+    Unquoted lines, the common case, are split on commas directly. A line
+    containing a quote is handed to csv.reader together with any following
+    lines its quoted fields span, so escaped commas, quotes and newlines
+    still parse exactly as before.
+    """
+    columns = _empty_columns()
+    dates = columns['date']
+    amounts = columns['amount']
+    categories = columns['category']
+    banks = columns['bank']
+
+    # A stray undecodable byte only garbles its own field instead of the whole ledger
+    with open(path, 'r', newline='', errors='replace', buffering=1 << 20) as f:
+        header = next(csv.reader([next(f, '')]), [])
+        width = len(header)
+        date_idx = header.index('date')
+        amount_idx = header.index('amount')
+        category_idx = header.index('category')
+        bank_idx = header.index('bank')
+
+        for line in f:
+            if '"' in line:
+                # A record ends at the first line break outside quotes
+                while line.count('"') % 2:
+                    more = next(f, '')
+                    if not more:
+                        break
+                    line += more
+                row = next(csv.reader([line]), [])
+            else:
+                row = line.rstrip('\r\n').split(',')
+            
+            if len(row) < width:
+                if row == [''] or not row:
+                    continue  # Blank line
+                row += [''] * (width - len(row))
+            try:
+                amount = float(row[amount_idx])
+            except ValueError:
+                continue  # Skip rows with an unreadable amount
+            dates.append(row[date_idx])
+            amounts.append(amount)
+            categories.append(row[category_idx])
+            banks.append(row[bank_idx].strip())
+
+    return columns
+
+
+def load_transactions(path: str = TRANSACTIONS_FILE) -> Dict[str, List]:
+    """
+    Load all transactions as columns, re-parsing only when the CSV changed
+
+    Rows whose amount is not a number are skipped. The returned lists are
+    shared between callers and must not be mutated.
+
+    Args:
+        path (str): Transactions CSV file
+
+    Returns:
+        Dict[str, List]: 'date', 'amount' (float), 'category' and 'bank'
+        lists, one entry per transaction in file order
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return _empty_columns()
+
+    entry = _txns_cache.get(path)
+    if entry is None or entry['mtime'] != st.st_mtime_ns or entry['size'] != st.st_size:
+        entry = {
+            'mtime': st.st_mtime_ns,
+            'size': st.st_size,
+            'columns': _parse_transactions(path)
+        }
+        _txns_cache[path] = entry
+    return entry['columns']